@@ -5,20 +5,75 @@ FIXED: Correct field names for ValidationResult
 
 import streamlit as st
 import sys
-import pandas as pd
+import gc
 from pathlib import Path
 from datetime import datetime
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from xml.sax.saxutils import escape
 import io
+import json
+from collections import Counter
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app_validators.validator import AEMBriefReviewer, Status, ValidationResult
 from app_validators.docx_extractor import DOCXExtractor
 from app_validators.url_extractor import URLExtractor
-from config import  OPENAI_API_KEY
+from config import  OPENAI_API_KEY, AI_BACKEND
+
+
+_ACCEPTED = Status.ACCEPTED.value
+
+# AI checks run with an OpenAI key, or on the local llama_cpp backend without one
+AI_ENABLED = bool(OPENAI_API_KEY) or AI_BACKEND == "llama_cpp"
+
+# Use case -> summary_data key (exact matches first, then substrings)
+_SUMMARY_EXACT_KEYS = {'H1': 'h1', 'H2': 'h2', 'H3': 'h3', 'H4': 'h4'}
+_SUMMARY_SUBSTRING_KEYS = (
+    ('Meta Title', 'meta_title'),
+    ('Meta Description', 'meta_description'),
+    ('Header Caption', 'header_caption'),
+    ('FAQ H2', 'faq_h2'),
+    ('FAQ Header', 'faq_h2'),
+    ('FAQ Question', 'faq_questions'),
+    ('FAQ Answer', 'faq_answers'),
+    ('Product Nav', 'product_nav'),
+    ('Tab', 'product_nav'),
+    ('CTA', 'cta'),
+)
+
+# Summary table rows as (label, summary_data key), shared by the UI and DOCX report
+_SUMMARY_COMPONENTS = (
+    ("Meta Title", "meta_title"),
+    ("Meta Description", "meta_description"),
+    ("H1", "h1"),
+    ("Header Caption", "header_caption"),
+    ("H2 Headers", "h2"),
+    ("H3 Headers", "h3"),
+    ("H4 Headers", "h4"),
+    ("FAQ H2 Header Name", "faq_h2"),
+    ("FAQ Questions", "faq_questions"),
+    ("FAQ Answers", "faq_answers"),
+    ("Product Navigation Tabs", "product_nav"),
+    ("CTA Section", "cta"),
+)
+
+# Shorter labels used in the DOCX report table
+_DOCX_COMPONENT_LABELS = {
+    "faq_h2": "FAQ H2 Header",
+    "product_nav": "Product Nav Tabs",
+}
+
+# Pre-rendered status cells for the summary table
+_STATUS_COLORS = {'PASS': '#198754', 'FAIL': '#dc3545', 'N/A': '#6c757d'}
+_STATUS_HTML = {
+    status: f'<span style="color:{color}; font-weight:bold;">{status}</span>'
+    for status, color in _STATUS_COLORS.items()
+}
 
 
 def init_session_state():
@@ -31,6 +86,29 @@ def init_session_state():
         st.session_state.summary_data = None
     if 'unknown_terms_report' not in st.session_state:
         st.session_state.unknown_terms_report = None
+    if 'passed_items' not in st.session_state:
+        st.session_state.passed_items = None
+    if 'failed_items' not in st.session_state:
+        st.session_state.failed_items = None
+    if 'passed_brief' not in st.session_state:
+        st.session_state.passed_brief = None
+    if 'validated_at' not in st.session_state:
+        st.session_state.validated_at = None
+
+
+@st.cache_data(show_spinner=False)
+def extract_docx_data(file_bytes: bytes) -> dict:
+    """Extract brief data from uploaded DOCX bytes (cached by content)."""
+    return DOCXExtractor.from_stream(io.BytesIO(file_bytes)).extract_brief_data()
+
+
+def extract_url_data(url: str) -> dict:
+    """
+    Extract brief data from a live URL. Not cached here: the extractor
+    revalidates its cached copy with a conditional GET, so a changed page
+    is picked up and an unchanged one costs a 304.
+    """
+    return URLExtractor(url).extract_brief_data().to_dict()
 
 
 def calculate_summary_data(validation_results, brief_data):
@@ -50,9 +128,10 @@ def calculate_summary_data(validation_results, brief_data):
         'cta': {'recognized': False, 'checked': 0, 'passed': 0, 'failed': 0}
     }
     
-    h2_count = len([h for h in brief_data.get('headers', []) if h['level'] == 'H2'])
-    h3_count = len([h for h in brief_data.get('headers', []) if h['level'] == 'H3'])
-    h4_count = len([h for h in brief_data.get('headers', []) if h['level'] == 'H4'])
+    header_counts = Counter(h['level'] for h in brief_data.get('headers', []))
+    h2_count = header_counts.get('H2', 0)
+    h3_count = header_counts.get('H3', 0)
+    h4_count = header_counts.get('H4', 0)
     faq_count = len(brief_data.get('faqs', {}).get('questions', []))
     tab_count = len(brief_data.get('product_nav', {}).get('tabs', []))
     
@@ -69,186 +148,178 @@ def calculate_summary_data(validation_results, brief_data):
         summary_data['cta']['checked'] = 1
     
     for result in validation_results:
-        status_key = 'passed' if result['status'] == Status.ACCEPTED.value else 'failed'
+        status_key = 'passed' if result['status'] == _ACCEPTED else 'failed'
+        use_case = result['use_case']
         
-        if 'Meta Title' in result['use_case']:
-            summary_data['meta_title'][status_key] += 1
-        elif 'Meta Description' in result['use_case']:
-            summary_data['meta_description'][status_key] += 1
-        elif result['use_case'] == 'H1':
-            summary_data['h1'][status_key] += 1
-        elif 'Header Caption' in result['use_case']:
-            summary_data['header_caption'][status_key] += 1
-        elif result['use_case'] == 'H2':
-            summary_data['h2'][status_key] += 1
-        elif result['use_case'] == 'H3':
-            summary_data['h3'][status_key] += 1
-        elif result['use_case'] == 'H4':
-            summary_data['h4'][status_key] += 1
-        elif 'FAQ H2' in result['use_case'] or 'FAQ Header' in result['use_case']:
-            summary_data['faq_h2'][status_key] += 1
-        elif 'FAQ Question' in result['use_case']:
-            summary_data['faq_questions'][status_key] += 1
-        elif 'FAQ Answer' in result['use_case']:
-            summary_data['faq_answers'][status_key] += 1
-        elif 'Product Nav' in result['use_case'] or 'Tab' in result['use_case']:
-            summary_data['product_nav'][status_key] += 1
-        elif 'CTA' in result['use_case']:
-            summary_data['cta'][status_key] += 1
+        key = _SUMMARY_EXACT_KEYS.get(use_case) or next(
+            (k for s, k in _SUMMARY_SUBSTRING_KEYS if s in use_case), None
+        )
+        if key:
+            summary_data[key][status_key] += 1
     
     return summary_data
 
 
 def render_validation_summary_table(summary_data):
-    rows = []
-    components = [
-        ("Meta Title", "meta_title"),
-        ("Meta Description", "meta_description"),
-        ("H1", "h1"),
-        ("Header Caption", "header_caption"),
-        ("H2 Headers", "h2"),
-        ("H3 Headers", "h3"),
-        ("H4 Headers", "h4"),
-        ("FAQ H2 Header Name", "faq_h2"),
-        ("FAQ Questions", "faq_questions"),
-        ("FAQ Answers", "faq_answers"),
-        ("Product Navigation Tabs", "product_nav"),
-        ("CTA Section", "cta")
-    ]
+    import pandas as pd  # deferred: only needed once results are shown
 
-    for label, key in components:
+    # Build the table column-wise; the schema is fixed
+    labels, recognized, checked, passed, failed, statuses = [], [], [], [], [], []
+    for label, key in _SUMMARY_COMPONENTS:
         data = summary_data[key]
         status = "N/A" if not data["recognized"] else ("PASS" if data["failed"] == 0 else "FAIL")
 
-        rows.append({
-            "Component": label,
-            "Recognized": "✓" if data["recognized"] else "✗",
-            "Checked": data["checked"],
-            "Passed": data["passed"],
-            "Failed": data["failed"],
-            "Status": status
-        })
-
-    df = pd.DataFrame(rows)
+        labels.append(label)
+        recognized.append("✓" if data["recognized"] else "✗")
+        checked.append(data["checked"])
+        passed.append(data["passed"])
+        failed.append(data["failed"])
+        statuses.append(_STATUS_HTML[status])
 
-    def style_status(val):
-        if val == "PASS":
-            return "color:#198754; font-weight:bold;"
-        if val == "FAIL":
-            return "color:#dc3545; font-weight:bold;"
-        return "color:#6c757d; font-weight:bold;"
+    df = pd.DataFrame({
+        "Component": labels,
+        "Recognized": recognized,
+        "Checked": checked,
+        "Passed": passed,
+        "Failed": failed,
+        "Status": statuses
+    })
 
     st.subheader("VALIDATION SUMMARY")
-    st.dataframe(df.style.map(style_status, subset=["Status"]), use_container_width=True)
+    st.markdown(df.to_html(escape=False, index=False), unsafe_allow_html=True)
+
+
+def _docx_row_xml(values, width, bold=False):
+    """Build the WordprocessingML for one table row."""
+    run_props = '<w:rPr><w:b/></w:rPr>' if bold else ''
+    cells = ''.join(
+        f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+        f'<w:p><w:r>{run_props}<w:t xml:space="preserve">{escape(value)}</w:t></w:r></w:p></w:tc>'
+        for value in values
+    )
+    return f'<w:tr>{cells}</w:tr>'
 
 
-def generate_docx_report(summary_data, validation_results):
-    """Generate DOCX report with all validation results."""
+def generate_docx_report(summary_data, passed_items, failed_items, generated_at=None):
+    """Generate DOCX report from pre-partitioned passed/failed results."""
+    if generated_at is None:
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     doc = Document()
+    add_heading = doc.add_heading
+    add_paragraph = doc.add_paragraph
     
     # Title
-    title = doc.add_heading('Fortinet Brief Validation Report', 0)
+    title = add_heading('Fortinet Brief Validation Report', 0)
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
     # Timestamp
-    timestamp = doc.add_paragraph(f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+    timestamp = add_paragraph(f'Generated: {generated_at}')
     timestamp.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
-    doc.add_paragraph()
+    add_paragraph()
     
     # Section 1: Validation Summary
-    doc.add_heading('1. VALIDATION SUMMARY', 1)
+    add_heading('1. VALIDATION SUMMARY', 1)
     
-    # Create summary table
-    table = doc.add_table(rows=1, cols=6)
+    # Create summary table (rows are built as one XML fragment and parsed once)
+    table = doc.add_table(rows=0, cols=6)
     table.style = 'Light Grid Accent 1'
+    col_width = table.columns[0].width.twips
     
     # Header row
-    hdr_cells = table.rows[0].cells
     headers = ['Component', 'Recognized', 'Checked', 'Passed', 'Failed', 'Status']
-    for i, header in enumerate(headers):
-        hdr_cells[i].text = header
-        hdr_cells[i].paragraphs[0].runs[0].font.bold = True
+    rows_xml = [_docx_row_xml(headers, col_width, bold=True)]
     
     # Data rows
-    components = [
-        ("Meta Title", "meta_title"),
-        ("Meta Description", "meta_description"),
-        ("H1", "h1"),
-        ("Header Caption", "header_caption"),
-        ("H2 Headers", "h2"),
-        ("H3 Headers", "h3"),
-        ("H4 Headers", "h4"),
-        ("FAQ H2 Header", "faq_h2"),
-        ("FAQ Questions", "faq_questions"),
-        ("FAQ Answers", "faq_answers"),
-        ("Product Nav Tabs", "product_nav"),
-        ("CTA Section", "cta")
-    ]
-    
-    for label, key in components:
+    for label, key in _SUMMARY_COMPONENTS:
+        label = _DOCX_COMPONENT_LABELS.get(key, label)
         data = summary_data[key]
         status = "N/A" if not data["recognized"] else ("PASS" if data["failed"] == 0 else "FAIL")
         
-        row_cells = table.add_row().cells
-        row_cells[0].text = label
-        row_cells[1].text = "✓" if data["recognized"] else "✗"
-        row_cells[2].text = str(data["checked"])
-        row_cells[3].text = str(data["passed"])
-        row_cells[4].text = str(data["failed"])
-        row_cells[5].text = status
+        rows_xml.append(_docx_row_xml([
+            label,
+            "✓" if data["recognized"] else "✗",
+            str(data["checked"]),
+            str(data["passed"]),
+            str(data["failed"]),
+            status
+        ], col_width))
     
-    doc.add_paragraph()
+    rows_elem = parse_xml(f'<w:tbl {nsdecls("w")}>{"".join(rows_xml)}</w:tbl>')
+    table._tbl.extend(list(rows_elem))
     
-    # Section 2: Failed Items
-    failed_items = [r for r in validation_results if r['status'] != Status.ACCEPTED.value]
+    add_paragraph()
     
+    # Section 2: Failed Items
     if failed_items:
-        doc.add_heading('2. FAILED ITEMS', 1)
-        doc.add_paragraph(f'Total: {len(failed_items)} issues found')
-        doc.add_paragraph()
+        add_heading('2. FAILED ITEMS', 1)
+        add_paragraph(f'Total: {len(failed_items)} issues found')
+        add_paragraph()
         
         for idx, item in enumerate(failed_items, 1):
-            doc.add_heading(f"{idx}. {item['use_case']} - {item['criterion']}", 2)
-            doc.add_paragraph(f"Category: {item['category']}")
-            doc.add_paragraph(f"Current: {item['location']}")
-            doc.add_paragraph(f"Recommended: {item['details']}")
+            add_heading(f"{idx}. {item['use_case']} - {item['criterion']}", 2)
+            add_paragraph(f"Category: {item['category']}")
+            add_paragraph(f"Current: {item['location']}")
+            add_paragraph(f"Recommended: {item['details']}")
             
             # Add AI info if available (FIXED FIELD NAMES)
             if item.get('ai_result'):
-                doc.add_paragraph(f"AI Correction: {item['ai_result']}")
+                add_paragraph(f"AI Correction: {item['ai_result']}")
             if item.get('unknown_terms'):
-                doc.add_paragraph(f"Unknown Terms: {', '.join(item['unknown_terms'])}")
+                add_paragraph(f"Unknown Terms: {', '.join(item['unknown_terms'])}")
             
-            doc.add_paragraph()
+            add_paragraph()
     
     # Section 3: Passed Items
-    passed_items = [r for r in validation_results if r['status'] == Status.ACCEPTED.value]
-    
     if passed_items:
-        doc.add_heading('3. PASSED ITEMS', 1)
-        doc.add_paragraph(f'Total: {len(passed_items)} items passed')
-        doc.add_paragraph()
+        add_heading('3. PASSED ITEMS', 1)
+        add_paragraph(f'Total: {len(passed_items)} items passed')
+        add_paragraph()
         
         for item in passed_items[:20]:
-            doc.add_paragraph(f"✓ {item['use_case']}: {item['location'][:80]}...", style='List Bullet')
+            add_paragraph(f"✓ {item['use_case']}: {item['location'][:80]}...", style='List Bullet')
         
         if len(passed_items) > 20:
-            doc.add_paragraph(f"... and {len(passed_items) - 20} more items")
+            add_paragraph(f"... and {len(passed_items) - 20} more items")
         
-        doc.add_paragraph()
+        add_paragraph()
     
     # Save to bytes
     doc_bytes = io.BytesIO()
     doc.save(doc_bytes)
     doc_bytes.seek(0)
     
-    return doc_bytes.getvalue()
+    # python-docx/lxml trees hold reference cycles; release them now
+    del doc
+    gc.collect()
+    
+    return doc_bytes
+
+
+@st.cache_data(show_spinner=False)
+def cached_docx_report(summary_json: str, passed_json: str, failed_json: str,
+                       generated_at: str) -> io.BytesIO:
+    """Generate the DOCX report once per validation run (generated_at is part of the key)."""
+    return generate_docx_report(
+        json.loads(summary_json),
+        json.loads(passed_json),
+        json.loads(failed_json),
+        generated_at
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_reviewer(openai_api_key=None, ai_backend=None):
+    """
+    Build the reviewer once and share it across reruns and sessions. It holds
+    only the shorthand lookup, the memoised case rules and the AI client;
+    review_brief keeps each call's results local, so sharing it is safe.
+    """
+    return AEMBriefReviewer(openai_api_key=openai_api_key, ai_backend=ai_backend)
 
 
-def validate_brief(brief_data, openai_api_key=None):
-    """Run validation on brief data with optional OpenAI integration."""
-    reviewer = AEMBriefReviewer(openai_api_key=openai_api_key)
+def validate_brief(brief_data, reviewer):
+    """Run validation on brief data using a shared reviewer."""
     results = reviewer.review_brief(brief_data)
     
     results_dict = []
@@ -275,6 +346,33 @@ def validate_brief(brief_data, openai_api_key=None):
     return results_dict
 
 
+@st.cache_data(show_spinner=False)
+def cached_validate_brief(brief_json: str, use_ai: bool):
+    """Validate a JSON-serialized brief, reusing results for identical briefs."""
+    reviewer = get_reviewer(OPENAI_API_KEY, AI_BACKEND) if use_ai else get_reviewer()
+    return validate_brief(json.loads(brief_json), reviewer)
+
+
+@st.cache_data(show_spinner=False)
+def build_failed_items_table(failed_json: str):
+    """Build the failed items DataFrame, reusing it until the failures change."""
+    reviewer = get_reviewer(OPENAI_API_KEY, AI_BACKEND) if AI_ENABLED else get_reviewer()
+    
+    result_objects = [
+        ValidationResult(
+            use_case=r['use_case'],
+            criterion=r['criterion'],
+            location=r['location'],
+            status=Status(r['status']),
+            details=r['details'],
+            category=r['category']
+        )
+        for r in json.loads(failed_json)
+    ]
+    
+    return reviewer.generate_failed_items_table(result_objects)
+
+
 def collect_unknown_terms(validation_results):
     """Collect all unknown terms from validation results."""
     unknown_by_section = {}
@@ -317,6 +415,10 @@ def main():
             st.session_state.validation_results = None
             st.session_state.summary_data = None
             st.session_state.unknown_terms_report = None
+            st.session_state.passed_items = None
+            st.session_state.failed_items = None
+            st.session_state.passed_brief = None
+            st.session_state.validated_at = None
             st.rerun()
     
     input_method = st.radio(
@@ -335,22 +437,14 @@ def main():
         )
         
         if uploaded_file is not None:
-            temp_path = Path(f"temp_{uploaded_file.name}")
-            with open(temp_path, 'wb') as f:
-                f.write(uploaded_file.getbuffer())
-            
             try:
                 with st.spinner("Extracting data from DOCX..."):
-                    extractor = DOCXExtractor(str(temp_path))
-                    brief_data = extractor.extract_brief_data()
+                    brief_data = extract_docx_data(uploaded_file.getvalue())
                 
                 st.success("✅ DOCX file processed successfully")
-                temp_path.unlink()
                 
             except Exception as e:
                 st.error(f"Error processing DOCX: {str(e)}")
-                if temp_path.exists():
-                    temp_path.unlink()
     
     else:
         url = st.text_input(
@@ -361,8 +455,7 @@ def main():
         if st.button("Fetch & Extract") and url:
             try:
                 with st.spinner("Fetching data from URL..."):
-                    extractor = URLExtractor(url)
-                    brief_data = extractor.extract_brief_data()
+                    brief_data = extract_url_data(url)
                 
                 st.success("✅ URL processed successfully")
                 
@@ -376,9 +469,9 @@ def main():
         if st.button("🔍 Run Validation", type="primary"):
             with st.spinner("Running validation with AI..."):
                 # Pass OpenAI key to validator
-                validation_results = validate_brief(
-                    st.session_state.brief_data,
-                    openai_api_key=OPENAI_API_KEY if OPENAI_API_KEY else None
+                validation_results = cached_validate_brief(
+                    json.dumps(st.session_state.brief_data, sort_keys=True),
+                    use_ai=AI_ENABLED
                 )
                 
                 summary_data = calculate_summary_data(validation_results, st.session_state.brief_data)
@@ -389,6 +482,15 @@ def main():
                 st.session_state.validation_results = validation_results
                 st.session_state.summary_data = summary_data
                 # st.session_state.unknown_terms_report = unknown_terms_report
+                
+                # Partition once so reruns don't re-filter the results
+                st.session_state.passed_items = [r for r in validation_results if r['status'] == _ACCEPTED]
+                st.session_state.failed_items = [r for r in validation_results if r['status'] != _ACCEPTED]
+                st.session_state.passed_brief = [
+                    (r['use_case'], r['location'][:80]) for r in st.session_state.passed_items
+                ]
+                # Report timestamp for this run; also keys the cached DOCX
+                st.session_state.validated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
             st.success("✅ Validation complete!")
     
@@ -398,15 +500,15 @@ def main():
         
         results = st.session_state.validation_results
         
+        passed_items = st.session_state.passed_items
+        failed_items = st.session_state.failed_items
+        
         # Calculate stats
         total = len(results)
-        passed = sum(1 for r in results if r['status'] == Status.ACCEPTED.value)
-        failed = total - passed
+        passed = len(passed_items)
+        failed = len(failed_items)
         pass_rate = (passed / total * 100) if total > 0 else 0
         
-        # Check for AI validated items
-        ai_items = [r for r in results if r.get('ai_validated')]
-        
         col1, col2, col3, col4 = st.columns(4)
         with col1:
             st.metric("Total Checks", total)
@@ -433,27 +535,7 @@ def main():
             st.markdown("---")
             st.subheader("❌ Failed Items")
             
-            reviewer = AEMBriefReviewer(openai_api_key=OPENAI_API_KEY)
-
-            
-            failed_results = [r for r in results if r['status'] != Status.ACCEPTED.value]
-            
-            result_objects = []
-            for r in failed_results:
-                obj = ValidationResult(
-                    use_case=r['use_case'],
-                    criterion=r['criterion'],
-                    location=r['location'],
-                    status=Status(r['status']),
-                    details=r['details'],
-                    category=r['category']
-                    # ai_validated=r.get('ai_validated', False),
-                    # ai_result=r.get('ai_result', ''),
-                    # unknown_terms=r.get('unknown_terms')
-                )
-                result_objects.append(obj)
-            
-            failed_table = reviewer.generate_failed_items_table(result_objects)
+            failed_table = build_failed_items_table(json.dumps(failed_items, sort_keys=True))
             
             if not failed_table.empty:
                 # Show AI columns if present
@@ -476,11 +558,11 @@ def main():
                 )
         
         # Passed Items
-        passed_items = [r for r in results if r['status'] == Status.ACCEPTED.value]
         if passed_items:
             with st.expander(f"✅ Passed Items ({len(passed_items)})"):
-                for item in passed_items:
-                    st.write(f"- {item['use_case']}: {item['location'][:80]}...")
+                st.markdown('\n'.join(
+                    f"- {use_case}: {location}..." for use_case, location in st.session_state.passed_brief
+                ))
         
         # Download Report Button
         st.markdown("---")
@@ -490,9 +572,11 @@ def main():
         
         with col1:
             # Generate DOCX report
-            docx_data = generate_docx_report(
-                st.session_state.summary_data,
-                st.session_state.validation_results
+            docx_data = cached_docx_report(
+                json.dumps(st.session_state.summary_data, sort_keys=True),
+                json.dumps(passed_items, sort_keys=True),
+                json.dumps(failed_items, sort_keys=True),
+                st.session_state.validated_at
             )
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
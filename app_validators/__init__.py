@@ -0,0 +1,30 @@
+"""
+Fortinet brief validators.
+
+AEM_LOG_LEVEL (env or .env) sets the log level for every module in this
+package and sends its messages to stderr; unknown level names are
+reported and ignored.
+"""
+
+import logging
+import os
+
+from dotenv import load_dotenv
+
+# The package can be imported before config.py loads .env
+load_dotenv()
+
+_log_level = os.getenv("AEM_LOG_LEVEL")
+if _log_level:
+    _log = logging.getLogger(__name__)
+    try:
+        _log.setLevel(_log_level.strip().upper())
+    except ValueError:
+        _log.warning("Ignoring unknown AEM_LOG_LEVEL %r", _log_level)
+    else:
+        # Without any handler only WARNING and above would get out (via
+        # logging.lastResort); an app that configured logging keeps its own
+        if not _log.handlers and not logging.getLogger().handlers:
+            _handler = logging.StreamHandler()
+            _handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+            _log.addHandler(_handler)
@@ -5,17 +5,101 @@ No content extraction
 """
 
 from docx import Document
-from typing import Dict, Any, List
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import nsmap, qn
+from docx.oxml.simpletypes import ST_Merge
+from lxml import etree
+from typing import Dict, Any, List, IO, Optional, Tuple, Union
+import logging
 import re
 
+log = logging.getLogger(__name__)
+
 
 class DOCXExtractor:
     """Extracts and structures content from DOCX files."""
     
-    def __init__(self, docx_path: str):
+    INTERNAL_LINKING_KEYWORDS = [
+        'internal linking',
+        'in links',
+        'out links',
+        'new in links',
+        'external linking',
+        'related links'
+    ]
+    
+    REMOVAL_KEYWORDS = [
+        'removed',
+        'this faq is removed',
+        'these existing faqs are removed',
+        'these faqs are removed',
+        'existing faqs are removed',
+        'delete this faq',
+        'to be removed',
+        'marked for removal',
+        '[removed]',
+        '(removed)',
+        'do not include',
+        'skip this',
+        'ignore this',
+        'not included',
+        'excluded'
+    ]
+    
+    # One alternation per keyword list, compiled once
+    _INTERNAL_LINKING_RE = re.compile(
+        '|'.join(re.escape(kw) for kw in INTERNAL_LINKING_KEYWORDS), re.IGNORECASE
+    )
+    _REMOVAL_RE = re.compile(
+        '|'.join(re.escape(kw) for kw in REMOVAL_KEYWORDS), re.IGNORECASE
+    )
+    _REMOVAL_STEMS = ('remov', 'delete', 'not include', 'skip', 'ignore', 'exclud')
+    
+    # Top-level table cells whose text mentions a URL, found in one libxml2 pass
+    _HTTP_CELLS_XPATH = etree.XPath(
+        './w:tbl/w:tr/w:tc[contains(string(.), "http")]', namespaces={'w': nsmap['w']}
+    )
+    
+    # Upper bound on paragraphs collected for a single FAQ answer
+    MAX_ANSWER_PARAGRAPHS = 20
+    
+    # Paragraph style name -> header level
+    _HEADING_LEVELS = {
+        'Heading 2': 'H2', 'Heading2': 'H2',
+        'Heading 3': 'H3', 'Heading3': 'H3',
+        'Heading 4': 'H4', 'Heading4': 'H4',
+    }
+    
+    def __init__(self, docx_path: Union[str, IO[bytes]]):
         self.doc = Document(docx_path)
-        self.all_paragraphs = list(self.doc.paragraphs)  # Cache for answer extraction
+        self._paras = self._build_para_cache()
+    
+    @classmethod
+    def from_stream(cls, stream: IO[bytes]) -> 'DOCXExtractor':
+        """Create an extractor from a file-like object (no temp file needed)."""
+        return cls(stream)
         
+    def _build_para_cache(self) -> List[Tuple[str, str, str, int]]:
+        """
+        Read each paragraph's stripped text, lowercase text and style name once.
+        Works on the body's <w:p> elements directly (no Paragraph wrappers) and
+        resolves each distinct style id against styles.xml only once.
+        """
+        get_style = self.doc.part.get_style
+        style_names: Dict[Optional[str], str] = {}
+        
+        paras = []
+        for idx, p in enumerate(self.doc.element.body.iterchildren(qn('w:p'))):
+            style_id = p.style
+            style_name = style_names.get(style_id)
+            if style_name is None:
+                style = get_style(style_id, WD_STYLE_TYPE.PARAGRAPH)
+                style_name = style_names[style_id] = style.name if style else ''
+            
+            text = p.text.strip()
+            paras.append((text, text.lower(), style_name, idx))
+        return paras
+    
     def extract_brief_data(self) -> Dict[str, Any]:
         """
         Extract all brief data from DOCX file.
@@ -77,49 +161,71 @@ class DOCXExtractor:
     
     def _extract_url(self) -> str:
         """Extract URL from document."""
-        for table in self.doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    text = cell.text.strip()
-                    if text.startswith('http'):
-                        return text
-        
-        for para in self.doc.paragraphs[:5]:
-            text = para.text.strip()
+        for tc in self._HTTP_CELLS_XPATH(self.doc.element.body):
+            text = self._cell_text(tc).strip()
+            if text.startswith('http'):
+                return text
+        
+        for text, _, _, _ in self._paras[:5]:
             if text.startswith('http'):
                 return text
         
         return ''
     
+    @staticmethod
+    def _cell_text(tc) -> str:
+        """Text of a <w:tc>, joined the way python-docx's cell.text does."""
+        return "\n".join(p.text for p in tc.iterchildren(qn('w:p')))
+    
+    @staticmethod
+    def _table_grid(tbl) -> List[List[Any]]:
+        """
+        <w:tc> elements of a table laid out by grid row, with spanned and
+        vertically merged cells repeated like python-docx's row.cells.
+        """
+        col_count = tbl.col_count
+        if not col_count:
+            return []
+        
+        cells = []
+        for tc in tbl.iter_tcs():
+            for grid_span_idx in range(tc.grid_span):
+                if tc.vMerge == ST_Merge.CONTINUE:
+                    cells.append(cells[-col_count])
+                elif grid_span_idx > 0:
+                    cells.append(cells[-1])
+                else:
+                    cells.append(tc)
+        
+        return [cells[i:i + col_count] for i in range(0, len(cells), col_count)]
+    
     def _extract_meta_title(self) -> str:
         """Extract meta title - handle 'No change' case."""
         existing_value = ""
         recommended_value = ""
         
         found_meta_title = False
-        for para in self.doc.paragraphs:
-            text = para.text.strip()
+        for text, text_lower, style_name, _ in self._paras:
             
-            if 'meta title' in text.lower() and ':' in text:
+            if ':' in text and 'meta title' in text_lower:
                 found_meta_title = True
                 continue
             
             if found_meta_title:
                 if text.startswith('Existing:'):
                     existing_value = text.replace('Existing:', '').strip()
-                    print(f"DEBUG: Found Existing Meta Title: {existing_value[:50]}...")
+                    log.debug("Found Existing Meta Title: %s...", existing_value[:50])
                 elif text.startswith('Recommended:'):
                     recommended_value = text.replace('Recommended:', '').strip()
-                    print(f"DEBUG: Found Recommended Meta Title: {recommended_value}")
+                    log.debug("Found Recommended Meta Title: %s", recommended_value)
                     
                     if 'no change' in recommended_value.lower():
-                        print(f"DEBUG: 'No change' detected, using Existing value")
+                        log.debug("'No change' detected, using Existing value")
                         return existing_value
                     else:
                         return recommended_value
                 
-                if 'meta description' in text.lower() or \
-                   (para.style and 'Heading' in para.style.name):
+                if 'meta description' in text_lower or 'Heading' in style_name:
                     break
         
         return recommended_value if recommended_value and 'no change' not in recommended_value.lower() else existing_value
@@ -130,83 +236,63 @@ class DOCXExtractor:
         recommended_value = ""
         
         found_meta_desc = False
-        for para in self.doc.paragraphs:
-            text = para.text.strip()
+        for text, text_lower, style_name, _ in self._paras:
             
-            if 'meta description' in text.lower() and ':' in text:
+            if ':' in text and 'meta description' in text_lower:
                 found_meta_desc = True
                 continue
             
             if found_meta_desc:
                 if text.startswith('Existing:'):
                     existing_value = text.replace('Existing:', '').strip()
-                    print(f"DEBUG: Found Existing Meta Description: {existing_value[:50]}...")
+                    log.debug("Found Existing Meta Description: %s...", existing_value[:50])
                 elif text.startswith('Recommended:'):
                     recommended_value = text.replace('Recommended:', '').strip()
-                    print(f"DEBUG: Found Recommended Meta Description: {recommended_value[:50]}...")
+                    log.debug("Found Recommended Meta Description: %s...", recommended_value[:50])
                     
                     if 'no change' in recommended_value.lower():
-                        print(f"DEBUG: 'No change' detected, using Existing value")
+                        log.debug("'No change' detected, using Existing value")
                         return existing_value
                     else:
                         return recommended_value
                 
-                if para.style and para.style.name in ['Heading 1', 'Heading1']:
+                if style_name in ['Heading 1', 'Heading1']:
                     break
         
         return recommended_value if recommended_value and 'no change' not in recommended_value.lower() else existing_value
     
     def _extract_h1(self) -> str:
         """Extract H1 from document."""
-        for para in self.doc.paragraphs:
-            if para.style and para.style.name in ['Heading 1', 'Heading1']:
-                return para.text.strip()
+        for text, text_lower, style_name, _ in self._paras:
+            if style_name in ['Heading 1', 'Heading1']:
+                return text
         return ''
     
     def _extract_header_caption(self) -> str:
         """Extract header caption (first paragraph after H1)."""
         h1_found = False
-        for para in self.doc.paragraphs:
-            if para.style and para.style.name in ['Heading 1', 'Heading1']:
+        for text, text_lower, style_name, _ in self._paras:
+            if style_name in ['Heading 1', 'Heading1']:
                 h1_found = True
                 continue
-            if h1_found and para.text.strip():
-                if not (para.style and 'Heading' in para.style.name):
-                    return para.text.strip()
+            if h1_found and text:
+                if 'Heading' not in style_name:
+                    return text
         return ''
     
     def _extract_headers(self) -> List[Dict[str, Any]]:
         """Extract all headers (H2, H3, H4) with their paragraph indices."""
         headers = []
-        for idx, para in enumerate(self.all_paragraphs):
-            if para.style:
-                style_name = para.style.name
-                text = para.text.strip()
-                
-                if not text:
-                    continue
-                
-                if style_name in ['Heading 2', 'Heading2']:
-                    headers.append({'level': 'H2', 'text': text, 'para_idx': idx})
-                elif style_name in ['Heading 3', 'Heading3']:
-                    headers.append({'level': 'H3', 'text': text, 'para_idx': idx})
-                elif style_name in ['Heading 4', 'Heading4']:
-                    headers.append({'level': 'H4', 'text': text, 'para_idx': idx})
+        for text, _, style_name, idx in self._paras:
+            level = self._HEADING_LEVELS.get(style_name)
+            if level and text:
+                headers.append({'level': level, 'text': text, 'para_idx': idx})
         
         return headers
     
     def _is_internal_linking_section(self, text: str) -> bool:
         """Check if this is Internal Linking section."""
-        keywords = [
-            'internal linking',
-            'in links',
-            'out links',
-            'new in links',
-            'external linking',
-            'related links'
-        ]
-        text_lower = text.lower().strip(':')
-        return any(kw in text_lower for kw in keywords)
+        return bool(self._INTERNAL_LINKING_RE.search(text))
     
     def _filter_internal_linking(self, headers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter out Internal Linking section and everything after it."""
@@ -214,34 +300,23 @@ class DOCXExtractor:
         
         for h in headers:
             if self._is_internal_linking_section(h['text']):
-                print(f"DEBUG: Filtering out Internal Linking section: {h['text']}")
+                log.debug("Filtering out Internal Linking section: %s", h['text'])
                 break
             
             filtered.append(h)
         
         return filtered
     
-    def _is_removed_faq(self, text: str) -> bool:
+    def _is_removed_faq(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Detect if FAQ is marked as removed."""
-        removal_keywords = [
-            'removed',
-            'this faq is removed',
-            'these existing faqs are removed',
-            'these faqs are removed',
-            'existing faqs are removed',
-            'delete this faq',
-            'to be removed',
-            'marked for removal',
-            '[removed]',
-            '(removed)',
-            'do not include',
-            'skip this',
-            'ignore this',
-            'not included',
-            'excluded'
-        ]
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in removal_keywords)
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Cheap substring prefilter: every removal keyword contains one of these
+        if not any(stem in text_lower for stem in self._REMOVAL_STEMS):
+            return False
+        
+        return bool(self._REMOVAL_RE.search(text_lower))
     
     def _extract_faq_answer(self, question_para_idx: int, next_header_para_idx: int) -> str:
         """
@@ -257,34 +332,29 @@ class DOCXExtractor:
         answer_paragraphs = []
         
         # Extract paragraphs between question and next header
-        for idx in range(question_para_idx + 1, next_header_para_idx):
-            para = self.all_paragraphs[idx]
-            text = para.text.strip()
+        for text, text_lower, style_name, _ in self._paras[question_para_idx + 1:next_header_para_idx]:
             
             # Skip empty paragraphs
             if not text:
                 continue
             
             # Check if this paragraph indicates removal
-            if self._is_removed_faq(text):
-                print(f"DEBUG: FAQ answer contains removal marker: {text[:50]}...")
+            if self._is_removed_faq(text, text_lower):
+                log.debug("FAQ answer contains removal marker: %s...", text[:50])
                 return ""  # Return empty - this FAQ should be skipped
             
             # Skip if it's a header (shouldn't happen but safety check)
-            if para.style and 'Heading' in para.style.name:
+            if 'Heading' in style_name:
                 break
             
             # Valid answer paragraph
             answer_paragraphs.append(text)
+            if len(answer_paragraphs) >= self.MAX_ANSWER_PARAGRAPHS:
+                break
         
-        # Combine answer paragraphs
+        # Combine answer paragraphs (each one was already checked for removal markers)
         answer = ' '.join(answer_paragraphs).strip()
         
-        # Final check - if answer itself contains removal text
-        if answer and self._is_removed_faq(answer):
-            print(f"DEBUG: Skipping FAQ - answer contains removal marker")
-            return ""
-        
         return answer if answer else "Answer extracted from document"
     
     def _extract_faqs(self, headers: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -300,11 +370,11 @@ class DOCXExtractor:
             if h['level'] == 'H2' and 'FAQ' in h['text'].upper():
                 faqs['header'] = h['text']
                 faq_h2_index = idx
-                print(f"DEBUG: Found FAQ H2 at header index {idx}: {h['text']}")
+                log.debug("Found FAQ H2 at header index %s: %s", idx, h['text'])
                 break
         
         if faq_h2_index is None:
-            print("DEBUG: No FAQ section found")
+            log.debug("No FAQ section found")
             return faqs
         
         # Extract FAQ questions (H3s after FAQ H2, before next H2)
@@ -313,7 +383,7 @@ class DOCXExtractor:
             
             # Stop at next H2
             if h['level'] == 'H2':
-                print(f"DEBUG: Stopped FAQ extraction at next H2: {h['text']}")
+                log.debug("Stopped FAQ extraction at next H2: %s", h['text'])
                 break
             
             # Only process H3 questions
@@ -322,7 +392,7 @@ class DOCXExtractor:
                 
                 # Check if question itself indicates removal
                 if self._is_removed_faq(question_text):
-                    print(f"DEBUG: Skipped removed FAQ question: {question_text}")
+                    log.debug("Skipped removed FAQ question: %s", question_text)
                     continue
                 
                 # Find next header to determine answer boundary
@@ -330,7 +400,7 @@ class DOCXExtractor:
                 if next_header_idx < len(headers):
                     next_header_para_idx = headers[next_header_idx]['para_idx']
                 else:
-                    next_header_para_idx = len(self.all_paragraphs)
+                    next_header_para_idx = len(self._paras)
                 
                 # Extract actual answer
                 answer_text = self._extract_faq_answer(h['para_idx'], next_header_para_idx)
@@ -341,24 +411,31 @@ class DOCXExtractor:
                         'question': question_text,
                         'answer': answer_text
                     })
-                    print(f"DEBUG: Added FAQ - Q: {question_text[:50]}... A: {answer_text[:50]}...")
+                    log.debug("Added FAQ - Q: %s... A: %s...", question_text[:50], answer_text[:50])
                 else:
-                    print(f"DEBUG: Skipped FAQ with empty/removed answer: {question_text}")
+                    log.debug("Skipped FAQ with empty/removed answer: %s", question_text)
         
-        print(f"DEBUG: Total FAQs extracted: {len(faqs['questions'])}")
+        log.debug("Total FAQs extracted: %s", len(faqs['questions']))
         return faqs
     def _extract_product_nav(self) -> List[Dict[str, str]]:
         """Extract Product Navigation tabs from correct table."""
         tabs = []
 
-        for table in self.doc.tables:
+        cell_text = self._cell_text
+
+        for tbl in self.doc.element.body.iterchildren(qn('w:tbl')):
+            # Lay the grid out once per table; row.cells rebuilt it for every row
+            rows = self._table_grid(tbl)
+            if not rows:
+                continue
+
             # Check header row
-            header_cells = [cell.text.strip().lower() for cell in table.rows[0].cells]
+            header_cells = [cell_text(tc).strip().lower() for tc in rows[0]]
 
             if "existing" in header_cells and "recommended" in header_cells:
                 # This is likely the Product Navigation table
-                for row in table.rows[1:]:
-                    cells = [cell.text.strip() for cell in row.cells]
+                for row in rows[1:]:
+                    cells = [cell_text(tc).strip() for tc in row]
 
                     if len(cells) >= 2:
                         recommended = cells[1]
@@ -372,7 +449,7 @@ class DOCXExtractor:
 
                 break  # stop after correct table found
 
-        print(f"DEBUG: Extracted {len(tabs)} Product Nav Tabs")
+        log.debug("Extracted %s Product Nav Tabs", len(tabs))
         return tabs
    
     def _extract_cta(self) -> Dict[str, str]:
@@ -385,10 +462,8 @@ class DOCXExtractor:
         
         faq_paragraph_idx = None
         
-        for idx, paragraph in enumerate(self.all_paragraphs):
-            text = paragraph.text.strip()
-            
-            if paragraph.style and paragraph.style.name in ['Heading 2', 'Heading2']:
+        for text, _, style_name, idx in self._paras:
+            if style_name in ['Heading 2', 'Heading2']:
                 if 'FAQ' in text.upper() or 'FREQUENTLY ASKED' in text.upper():
                     faq_paragraph_idx = idx
                     break
@@ -397,10 +472,9 @@ class DOCXExtractor:
             cta_paragraphs = []
             
             for idx in range(faq_paragraph_idx - 1, max(0, faq_paragraph_idx - 10), -1):
-                para = self.all_paragraphs[idx]
-                text = para.text.strip()
+                text, _, style_name, _ = self._paras[idx]
                 
-                if para.style and 'Heading' in para.style.name:
+                if 'Heading' in style_name:
                     break
                 
                 if text and 50 < len(text) < 1000:
@@ -3,17 +3,34 @@ OpenAI Validator Module
 Hybrid validation: Rule-based + AI-powered checks
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
-from typing import Dict, List, Tuple
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 import re
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
+# Same acronym-plural fixes as the rule-based validator
+from app_validators.validator import _ACRONYM_RE, _acronym_repl
+
+log = logging.getLogger(__name__)
+
+# One comma-separated term (leading whitespace and empty entries skipped)
+_TERM_SPLIT = re.compile(r'[^\s,][^,]*')
+
+# One "S<n>: ..." line of a batched unknown-terms response
+_BATCH_LINE_RE = re.compile(r'^\s*\[?S(\d+)\]?\s*:\s*(.*)$')
 
 class OpenAIValidator:
     """AI-powered validation using OpenAI API."""
     
     # Known common abbreviations (beyond Fortinet terms)
-    COMMON_ABBREVIATIONS = {
+    COMMON_ABBREVIATIONS = frozenset({
         'ci/cd', 'cicd', 'ci-cd',
         'sso', 'mfa', '2fa',
         'saas', 'paas', 'iaas',
@@ -28,89 +45,22 @@ class OpenAIValidator:
         'ui', 'ux',
         'pdf', 'csv',
         'usa', 'uk', 'eu'
-    }
+    })
+    
+    # Joined once; sorted so the prompt text is stable across runs
+    _COMMON_TERMS_STR = ", ".join(sorted(COMMON_ABBREVIATIONS))
+    
+    # Words Title Case keeps lowercase unless first or last
+    _TITLE_MINOR_WORDS = frozenset({
+        'a', 'an', 'the',
+        'vs', 'and', 'but', 'or', 'for', 'nor',
+        'as', 'at', 'by', 'in', 'of', 'off', 'on', 'out', 'per', 'to', 'up', 'via',
+        'from', 'into', 'onto', 'over', 'upon', 'with'
+    })
+    
+    # Stripped from word edges before the fast-path checks
+    _WORD_PUNCTUATION = '.,:;!?()[]{}"\'‘’“”-–—&/'
     
-    # Title Case Prompt (from client)
-    TITLE_CASE_PROMPT = """You are a verbatim casing machine.
-
-Task:
-1. Accept exactly one line of text.
-2. Convert the entire line to strict US-English Title Case.
-   • Capitalize all nouns, verbs, adjectives, adverbs, pronouns.
-   • Lowercase articles (a, an, the), coordinating conjunctions (vs, and, but, or, for, nor), and prepositions ≤4 letters unless they are the first or last word.
-
-CRITICAL EXCEPTIONS - PRESERVE EXACTLY AS-IS:
-ACRONYM PLURALS - NEVER CHANGE THESE:
-   • Pattern: Uppercase acronym + lowercase 's' → VPNs, APIs, URLs, SDKs, VMs, IPs
-   • VPNs must stay VPNs (NOT Vpns, NOT vpns, NOT VPNS)
-   • APIs must stay APIs (NOT Apis, NOT apis, NOT APIS)
-   • If you see VPNs → output VPNs exactly as-is
-   • If you see APIs → output APIs exactly as-is
-   • This applies to ALL acronyms ending in lowercase 's'
-   • Fortinet products: ANY word starting with "Forti" (FortiCNAPP, FortiDevOps, FortiCode, FortiPentest, FortiGuard, etc.) - preserve EXACT casing
-   • Acronym plurals: Uppercase acronyms ending in lowercase 's' (VPNs, APIs, URLs, etc.) - preserve as-is
-   • Technical acronyms: SIEM, SOAR, XDR, EDR, NDR, MDR, IPS, IDS, WAF, DDoS, etc. - keep UPPERCASE
-
-3. If the converted string is character-for-character identical to the input, output exactly: No change
-   Otherwise output the converted string—do not drop, add, or reorder any characters, words, or punctuation.
-EXAMPLES OF CORRECT BEHAVIOR:
-❌ WRONG: "Understanding VPNs" → "Understanding Vpns"
-✅ CORRECT: "Understanding VPNs" → "Understanding VPNs"
-
-❌ WRONG: "FortiCNAPP Security" → "Forticnapp Security"
-✅ CORRECT: "FortiCNAPP Security" → "FortiCNAPP Security"
-
-❌ WRONG: "Multiple APIs and VPNs" → "Multiple Apis and Vpns"
-✅ CORRECT: "Multiple APIs and VPNs" → "Multiple APIs and VPNs"
-Zero tolerance for omissions.
-• Fortinet product names must remain EXACTLY as official branding.
-• Any occurrence of the product name "Fortinet Security Fabric" must remain EXACTLY as official branding.
-• Never change the casing of "Security" or "Fabric" when they are part of "Fortinet Security Fabric".
-• If the phrase appears inside a longer sentence, preserve it exactly as written.
-
-Input:
-{text}
-
-Output:"""
-
-    # Sentence Case Prompt (from client)
-    SENTENCE_CASE_PROMPT = """You are a sentence-case formatter.
-
-Task: convert the provided string to exact US professional English Sentence Case and return ONLY the result or "No change" if already correct.
-
-Sentence Case rules:
-* Capitalize the first word and proper nouns (e.g., Gordon-Loeb, NIST, Fortinet).
-* Generic cybersecurity terms (firewall, threat actor, endpoint detection, etc.) are NOT proper nouns.
-
-CRITICAL EXCEPTIONS - PRESERVE EXACTLY AS-IS:
-ACRONYM PLURALS - NEVER CHANGE THESE:
-   • Pattern: Uppercase acronym + lowercase 's' → VPNs, APIs, URLs, SDKs, VMs, IPs
-   • VPNs must stay VPNs (NOT Vpns, NOT vpns, NOT VPNS)
-   • APIs must stay APIs (NOT Apis, NOT apis, NOT APIS)
-   • If you see VPNs → output VPNs exactly as-is
-   • If you see APIs → output APIs exactly as-is
-   • This applies to ALL acronyms ending in lowercase 's'
-* Fortinet products: ANY word starting with "Forti" (FortiCNAPP, FortiDevOps, FortiCode, FortiPentest, FortiGuard, etc.) - preserve EXACT casing
-* Acronym plurals: Uppercase acronyms ending in lowercase 's' (VPNs, APIs, URLs, SDKs, etc.) - preserve as-is
-* Technical acronyms: SIEM, SOAR, XDR, EDR, NDR, MDR, IPS, IDS, WAF, DDoS, AppSec, DevSecOps, etc. - keep UPPERCASE
-EXAMPLES OF CORRECT BEHAVIOR:
-❌ WRONG: "Understanding VPNs and how they work" → "Understanding Vpns and how they work"
-✅ CORRECT: "Understanding VPNs and how they work" → "Understanding VPNs and how they work"
-
-❌ WRONG: "FortiCNAPP provides security" → "Forticnapp provides security"
-✅ CORRECT: "FortiCNAPP provides security" → "FortiCNAPP provides security"
-
-❌ WRONG: "Multiple APIs and VPNs" → "Multiple Apis and Vpns"
-✅ CORRECT: "Multiple APIs and VPNs" → "Multiple APIs and VPNs"
-• Fortinet product names must remain EXACTLY as official branding.
-• Any occurrence of the product name "Fortinet Security Fabric" must remain EXACTLY as official branding.
-• Never change the casing of "Security" or "Fabric" when they are part of "Fortinet Security Fabric".
-• If the phrase appears inside a longer sentence, preserve it exactly as written.
-Input:
-{text}
-
-Output:"""
-
     # Unknown Terms Detection Prompt
     UNKNOWN_TERMS_PROMPT = """You are a technical abbreviation and acronym detector for cybersecurity content.
 
@@ -137,106 +87,411 @@ If no unknown terms, respond:
 CLEAR
 
 Output:"""
+
+    # Batched Unknown Terms Detection Prompt (one request for many sections)
+    UNKNOWN_TERMS_BATCH_PROMPT = """You are a technical abbreviation and acronym detector for cybersecurity content.
+
+Known Fortinet Terms: {fortinet_terms}
+
+Common Abbreviations: {common_terms}
+
+Task:
+Each numbered text below is tagged [S1], [S2], ... Analyze EACH text separately and identify ANY technical abbreviations, acronyms, or specialized terms that are NOT in the known lists above.
+
+Rules:
+1. Only flag technical/specialized terms (not common English words)
+2. Flag abbreviations in ANY case (uppercase, lowercase, mixed)
+3. Include product names, technical acronyms, industry terms
+4. Do NOT flag terms already in the known lists
+
+Texts to analyze:
+{texts}
+
+Respond with exactly one line per text, in the same order, using this format:
+S1: term1, term2
+S2: CLEAR
+
+Output:"""
+
+    # Max sections sent in a single batched request
+    UNKNOWN_TERMS_BATCH_SIZE = 20
+    
+    # Combined Prompt: both case checks and unknown terms in one JSON response
+    VALIDATE_ALL_PROMPT = """You are a precise text formatting assistant and technical abbreviation detector for Fortinet cybersecurity content.
+
+Perform THREE independent tasks on the input text and respond with ONLY a JSON object:
+{{"title_case": "<converted text or No change>", "sentence_case": "<converted text or No change>", "unknown_terms": ["term1", "term2"]}}
+
+Task "title_case": convert the text to strict US-English Title Case.
+   • Capitalize all nouns, verbs, adjectives, adverbs, pronouns.
+   • Lowercase articles (a, an, the), coordinating conjunctions (vs, and, but, or, for, nor), and prepositions ≤4 letters unless they are the first or last word.
+
+Task "sentence_case": convert the text to exact US professional English Sentence case.
+   • Capitalize the first word and proper nouns (e.g., Gordon-Loeb, NIST, Fortinet).
+   • Generic cybersecurity terms (firewall, threat actor, endpoint detection, etc.) are NOT proper nouns.
+
+For both case tasks:
+   • If the converted string is character-for-character identical to the input, use exactly: No change
+   • Otherwise give the converted string—do not drop, add, or reorder any characters, words, or punctuation.
+
+CRITICAL EXCEPTIONS FOR BOTH CASE TASKS - PRESERVE EXACTLY AS-IS:
+   • Acronym plurals: Uppercase acronym + lowercase 's' (VPNs, APIs, URLs, SDKs, VMs, IPs) - NEVER Vpns, vpns or VPNS
+   • Fortinet products: ANY word starting with "Forti" (FortiCNAPP, FortiDevOps, FortiCode, FortiPentest, FortiGuard, etc.) - preserve EXACT casing
+   • Technical acronyms: SIEM, SOAR, XDR, EDR, NDR, MDR, IPS, IDS, WAF, DDoS, AppSec, DevSecOps, etc. - keep UPPERCASE
+   • "Fortinet Security Fabric" must remain EXACTLY as official branding, also inside a longer sentence.
+
+Task "unknown_terms": list ANY technical abbreviations, acronyms, or specialized terms that are NOT in the known lists below.
+   1. Only flag technical/specialized terms (not common English words)
+   2. Flag abbreviations in ANY case (uppercase, lowercase, mixed)
+   3. Include product names, technical acronyms, industry terms
+   4. Do NOT flag terms already in the known lists
+   Use an empty list if there are none.
+
+Known Fortinet Terms: {fortinet_terms}
+
+Common Abbreviations: {common_terms}
+
+Input:
+{text}"""
+    
+    MODEL = "gpt-4o-mini"
+    
+    # Bump when a prompt changes so persisted results are not reused
+    PROMPT_VERSION = "1"
+    
+    # Context window for the local llama_cpp backend (fits the batched prompt)
+    LLAMA_N_CTX = 4096
+    
+    # Max results kept in the in-memory memo (the SQLite cache is unbounded)
+    MEMO_SIZE = 4096
+    
     def _fix_acronym_plurals(self, text: str) -> str:
         """
         Post-process OpenAI output to fix common acronym plural mistakes.
         Fixes: Vpns → VPNs, Apis → APIs, Urls → URLs, etc.
         """
-        import re
-        
-        # Common acronym patterns that should be uppercase + lowercase 's'
-        acronym_patterns = {
-            r'\bVpns\b': 'VPNs',
-            r'\bApis\b': 'APIs',
-            r'\bUrls\b': 'URLs',
-            r'\bSdks\b': 'SDKs',
-            r'\bVms\b': 'VMs',
-            r'\bIps\b': 'IPs',
-            r'\bIds\b': 'IDs',
-            r'\bFaqs\b': 'FAQs',
-            r'\bPdfs\b': 'PDFs',
-            r'\bCsvs\b': 'CSVs',
-            r'\bSlas\b': 'SLAs',
-            r'\bKpis\b': 'KPIs',
-        }
+        return _ACRONYM_RE.sub(_acronym_repl, text)
+    
+    def __init__(self, api_key: str, fortinet_shorthands: Dict[str, str], cache_path: Optional[str] = None,
+                 backend: Optional[str] = None, model_path: Optional[str] = None):
+        """
+        Initialize OpenAI validator.
         
-        for pattern, replacement in acronym_patterns.items():
-            text = re.sub(pattern, replacement, text)
+        Args:
+            cache_path: Optional SQLite file for reusing results across runs
+                        (defaults to the AI_CACHE_PATH environment variable)
+            backend: 'openai' (default) or 'llama_cpp' for a local quantized model
+                     (defaults to the AI_BACKEND environment variable)
+            model_path: GGUF model file for the llama_cpp backend
+                        (defaults to the LLAMA_MODEL_PATH environment variable)
+        """
+        self.api_key = api_key
+        self.backend = backend or os.getenv("AI_BACKEND") or "openai"
+        self.client = None
+        self._llama = None
+        
+        if self.backend == "openai":
+            self.client = OpenAI(api_key=api_key)
+            self.model_id = self.MODEL
+        elif self.backend == "llama_cpp":
+            model_path = model_path or os.getenv("LLAMA_MODEL_PATH")
+            if not model_path:
+                raise ValueError("llama_cpp backend requires model_path or LLAMA_MODEL_PATH")
+            try:
+                from llama_cpp import Llama
+            except ImportError:
+                raise ImportError("llama_cpp backend requires: pip install llama-cpp-python")
+            self._llama = Llama(model_path=model_path, n_ctx=self.LLAMA_N_CTX, n_batch=512, verbose=False)
+            self._llama_lock = threading.Lock()  # Llama instances are not thread-safe
+            self.model_id = f"llama_cpp:{os.path.basename(model_path)}"
+        else:
+            raise ValueError(f"Unknown AI backend: {self.backend}")
         
-        return text
-    def __init__(self, api_key: str, fortinet_shorthands: Dict[str, str]):
-        """Initialize OpenAI validator."""
-        self.client = OpenAI(api_key=api_key)
         self.fortinet_shorthands = fortinet_shorthands
+        self._fortinet_terms_str = ", ".join(sorted(fortinet_shorthands))
         
-    def validate_title_case(self, text: str) -> Tuple[bool, str, str]:
-        """
-        Validate Title Case using OpenAI.
+        # Terms whose casing only the model can judge; texts containing them
+        # never take the rule-based fast path
+        self._known_words = frozenset(
+            term for term in fortinet_shorthands if ' ' not in term
+        ) | self.COMMON_ABBREVIATIONS
+        self._known_phrases = tuple(term for term in fortinet_shorthands if ' ' in term)
         
-        Returns:
-            (is_valid, corrected_text, explanation)
+        # Identical inputs give identical outputs, so results are memoized
+        # per (prompt, kind, text): prompt is the request that produced the
+        # answer ('validate_all', 'unknown_terms', 'unknown_terms_batch') and
+        # kind is 'title', 'sentence' or 'unknown'. Least recently used
+        # entries are dropped past MEMO_SIZE.
+        self._memo: 'OrderedDict[Tuple[str, str, str], Any]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_db = None
+        
+        cache_path = cache_path or os.getenv("AI_CACHE_PATH")
+        if cache_path:
+            self._cache_db = sqlite3.connect(cache_path, check_same_thread=False)
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS ai_cache (key TEXT PRIMARY KEY, value TEXT)"
+            )
+    
+    def _cache_key(self, prompt: str, kind: str, text: str) -> str:
+        """Persistent cache key for a result."""
+        raw = f"{self.PROMPT_VERSION}\0{self.model_id}\0{prompt}\0{kind}\0{text}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    
+    def _memo_get(self, key: Tuple[str, str, str]) -> Optional[Any]:
+        with self._cache_lock:
+            value = self._memo.get(key)
+            if value is not None:
+                self._memo.move_to_end(key)
+            return value
+    
+    def _memo_put(self, key: Tuple[str, str, str], value: Any) -> None:
+        with self._cache_lock:
+            self._memo[key] = value
+            self._memo.move_to_end(key)
+            if len(self._memo) > self.MEMO_SIZE:
+                self._memo.popitem(last=False)
+    
+    def _cache_get(self, prompt: str, kind: str, text: str) -> Optional[Any]:
+        """Return a memoized result, or None on a miss."""
+        value = self._memo_get((prompt, kind, text))
+        if value is not None or self._cache_db is None:
+            return value
+        
+        with self._cache_lock:
+            row = self._cache_db.execute(
+                "SELECT value FROM ai_cache WHERE key = ?", (self._cache_key(prompt, kind, text),)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        value = json.loads(row[0])
+        if kind != 'unknown':
+            value = tuple(value)
+        self._memo_put((prompt, kind, text), value)
+        return value
+    
+    def _cache_put(self, prompt: str, kind: str, text: str, value: Any) -> None:
+        """Memoize a successful result."""
+        self._memo_put((prompt, kind, text), value)
+        if self._cache_db is None:
+            return
+        
+        with self._cache_lock:
+            self._cache_db.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, value) VALUES (?, ?)",
+                (self._cache_key(prompt, kind, text), json.dumps(value))
+            )
+            self._cache_db.commit()
+    
+    def _has_known_terms(self, words: List[str], text_lower: str) -> bool:
+        """True if the text mentions a Fortinet/common term or a Forti* product."""
+        return (
+            any(w in self._known_words or w.startswith('forti') for w in words)
+            or any(phrase in text_lower for phrase in self._known_phrases)
+        )
+    
+    def _fast_title_ok(self, text: str) -> bool:
         """
-        if not text:
-            return True, "", ""
+        Cheap check for text that is plainly in Title Case: simple alphabetic
+        words, significant ones capitalized, minor ones lowercase mid-line.
+        Anything unusual (acronyms, mixed case, known terms) returns False.
+        """
+        words = [w.strip(self._WORD_PUNCTUATION) for w in text.split()]
+        words = [w for w in words if w]
+        if not words:
+            return False
         
-        try:
-            prompt = self.TITLE_CASE_PROMPT.format(text=text)
+        last = len(words) - 1
+        for i, word in enumerate(words):
+            if word.isdigit():
+                continue
+            if not word.isalpha():
+                return False
             
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a precise text formatting assistant."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0,
-                max_tokens=500
-            )
+            lower = word.lower()
+            if lower in self._TITLE_MINOR_WORDS and 0 < i < last:
+                if word != lower:
+                    return False
+            elif not (word[0].isupper() and word[1:] == word[1:].lower()):
+                return False
+        
+        return not self._has_known_terms([w.lower() for w in words], text.lower())
+    
+    def _fast_sentence_ok(self, text: str) -> bool:
+        """
+        Cheap check for text that is plainly in Sentence case: the first word
+        of each sentence capitalized, everything else lowercase, no known terms.
+        """
+        words = []
+        sentence_start = True
+        
+        for token in text.split():
+            word = token.strip(self._WORD_PUNCTUATION)
+            if word:
+                if sentence_start:
+                    if not (word.isalpha() and word[0].isupper() and word[1:] == word[1:].lower()):
+                        return False
+                elif token != token.lower():
+                    return False
+                words.append(word.lower())
+                sentence_start = False
             
-            result = response.choices[0].message.content.strip()
-            result = self._fix_acronym_plurals(result)
-            if result == "No change":
-                return True, text, "Already in correct Title Case"
-            else:
-                return False, result, f"Should be: {result}"
-                
-        except Exception as e:
-            print(f"OpenAI Title Case Error: {e}")
-            return True, text, f"AI validation failed: {str(e)}"
+            # The next word starts a sentence after . ! or ?
+            if token.rstrip('"\')]\'’”')[-1:] in ('.', '!', '?'):
+                sentence_start = True
+        
+        if not words:
+            return False
+        
+        return not self._has_known_terms(words, text.lower())
+    
+    def _complete(self, request: Dict) -> str:
+        """Run one chat completion on the configured backend and return its text."""
+        if self._llama is not None:
+            params = {k: v for k, v in request.items() if k != 'model'}
+            with self._llama_lock:
+                response = self._llama.create_chat_completion(**params)
+            return response['choices'][0]['message']['content'].strip()
+        
+        response = self.client.chat.completions.create(**request)
+        return response.choices[0].message.content.strip()
     
-    def validate_sentence_case(self, text: str) -> Tuple[bool, str, str]:
+    def _parse_case_response(self, text: str, content: str, case_name: str) -> Tuple[bool, str, str]:
+        """Turn a case check completion into (is_valid, corrected_text, explanation)."""
+        result = self._fix_acronym_plurals(content.strip())
+        
+        if result == "No change":
+            return True, text, f"Already in correct {case_name}"
+        else:
+            return False, result, f"Should be: {result}"
+    
+    def _validate_all_request(self, text: str) -> Dict:
+        """Build chat completion arguments for the combined JSON check."""
+        prompt = self.VALIDATE_ALL_PROMPT.format(
+            fortinet_terms=self._fortinet_terms_str,
+            common_terms=self._COMMON_TERMS_STR,
+            text=text
+        )
+        
+        return dict(
+            model=self.MODEL,
+            messages=[
+                {"role": "system", "content": "You are a precise text formatting assistant. Respond in JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0,
+            max_tokens=800,
+            response_format={"type": "json_object"}
+        )
+    
+    def _parse_validate_all(self, text: str, content: str) -> Dict:
+        """Turn a combined JSON completion into per-task results and memoize them."""
+        data = json.loads(content)
+        
+        result = {
+            'title_case': self._parse_case_response(text, str(data.get('title_case') or 'No change'), "Title Case"),
+            'sentence_case': self._parse_case_response(text, str(data.get('sentence_case') or 'No change'), "Sentence case"),
+            'unknown_terms': [str(t).strip() for t in data.get('unknown_terms') or [] if str(t).strip()],
+        }
+        
+        self._cache_put('validate_all', 'title', text, result['title_case'])
+        self._cache_put('validate_all', 'sentence', text, result['sentence_case'])
+        self._cache_put('validate_all', 'unknown', text, result['unknown_terms'])
+        return result
+    
+    def _validate_all_cached(self, text: str) -> Optional[Dict]:
+        """Combined result from the fast paths and memo, or None if a request is needed."""
+        # A verdict the model already gave wins over the fast paths
+        title = self._cache_get('validate_all', 'title', text)
+        if title is None and self._fast_title_ok(text):
+            title = (True, text, "Already in correct Title Case")
+        sentence = self._cache_get('validate_all', 'sentence', text)
+        if sentence is None and self._fast_sentence_ok(text):
+            sentence = (True, text, "Already in correct Sentence case")
+        unknown = self._cache_get('validate_all', 'unknown', text)
+        
+        if title is None or sentence is None or unknown is None:
+            return None
+        return {'title_case': title, 'sentence_case': sentence, 'unknown_terms': list(unknown)}
+    
+    def _validate_all_failed(self, text: str, error: Exception) -> Dict:
+        """Combined result when the request fails (same fallbacks as the single checks)."""
+        log.warning("OpenAI Combined Validation Error: %s", error)
+        failed = (True, text, f"AI validation failed: {str(error)}")
+        return {'title_case': failed, 'sentence_case': failed, 'unknown_terms': []}
+    
+    def validate_all(self, text: str) -> Dict:
         """
-        Validate Sentence case using OpenAI.
+        Title Case, Sentence case and unknown terms for one text in a single request.
         
         Returns:
-            (is_valid, corrected_text, explanation)
+            {
+                'title_case': (is_valid, corrected_text, explanation),
+                'sentence_case': (is_valid, corrected_text, explanation),
+                'unknown_terms': List[str]
+            }
         """
         if not text:
-            return True, "", ""
+            return {'title_case': (True, "", ""), 'sentence_case': (True, "", ""), 'unknown_terms': []}
+        
+        cached = self._validate_all_cached(text)
+        if cached is not None:
+            return cached
         
         try:
-            prompt = self.SENTENCE_CASE_PROMPT.format(text=text)
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a precise text formatting assistant."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0,
-                max_tokens=500
-            )
-            
-            result = response.choices[0].message.content.strip()
-            result = self._fix_acronym_plurals(result)
-            
-            if result == "No change":
-                return True, text, "Already in correct Sentence case"
-            else:
-                return False, result, f"Should be: {result}"
-                
+            content = self._complete(self._validate_all_request(text))
+            return self._parse_validate_all(text, content)
+        except Exception as e:
+            return self._validate_all_failed(text, e)
+    
+    async def avalidate_all(self, client: AsyncOpenAI, text: str) -> Dict:
+        """Async version of validate_all."""
+        if not text:
+            return {'title_case': (True, "", ""), 'sentence_case': (True, "", ""), 'unknown_terms': []}
+        
+        cached = self._validate_all_cached(text)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await client.chat.completions.create(**self._validate_all_request(text))
+            content = response.choices[0].message.content
+            return self._parse_validate_all(text, content)
         except Exception as e:
-            print(f"OpenAI Sentence Case Error: {e}")
-            return True, text, f"AI validation failed: {str(e)}"
+            return self._validate_all_failed(text, e)
+    
+    def _unknown_terms_request(self, text: str) -> Dict:
+        """Build chat completion arguments for unknown terms detection."""
+        prompt = self.UNKNOWN_TERMS_PROMPT.format(
+            fortinet_terms=self._fortinet_terms_str,
+            common_terms=self._COMMON_TERMS_STR,
+            text=text
+        )
+        
+        return dict(
+            model=self.MODEL,
+            messages=[
+                {"role": "system", "content": "You are a technical term analysis assistant."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0,
+            max_tokens=200
+        )
+    
+    def _parse_unknown_terms(self, content: str) -> List[str]:
+        """Turn an unknown terms completion into a list of terms."""
+        result = content.strip()
+        
+        if result == "CLEAR":
+            return []
+        
+        # Parse unknown terms
+        if result.startswith("UNKNOWN:"):
+            terms_str = result.replace("UNKNOWN:", "").strip()
+            return [t.strip() for t in _TERM_SPLIT.findall(terms_str)]
+        
+        return []
     
     def detect_unknown_terms(self, text: str) -> List[str]:
         """
@@ -248,51 +503,106 @@ Output:"""
         if not text:
             return []
         
+        cached = self._cache_get('unknown_terms', 'unknown', text)
+        if cached is not None:
+            return list(cached)
+        
         try:
-            # Prepare known terms lists
-            fortinet_terms = ", ".join(self.fortinet_shorthands.keys())
-            common_terms = ", ".join(self.COMMON_ABBREVIATIONS)
-            
-            prompt = self.UNKNOWN_TERMS_PROMPT.format(
-                fortinet_terms=fortinet_terms,
-                common_terms=common_terms,
-                text=text
-            )
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a technical term analysis assistant."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0,
-                max_tokens=200
-            )
-            
-            result = response.choices[0].message.content.strip()
-            
-            if result == "CLEAR":
-                return []
-            
-            # Parse unknown terms
-            if result.startswith("UNKNOWN:"):
-                terms_str = result.replace("UNKNOWN:", "").strip()
-                terms = [t.strip() for t in terms_str.split(",")]
-                return [t for t in terms if t]  # Filter empty strings
-            
-            return []
+            content = self._complete(self._unknown_terms_request(text))
+            terms = self._parse_unknown_terms(content)
+            self._cache_put('unknown_terms', 'unknown', text, terms)
+            return list(terms)
                 
         except Exception as e:
-            print(f"OpenAI Unknown Terms Error: {e}")
+            log.warning("OpenAI Unknown Terms Error: %s", e)
             return []
+    
+    def detect_unknown_terms_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Detect unknown terms for many texts with one request per chunk.
+        
+        Returns:
+            List of unknown-term lists, aligned with `texts`
+        """
+        found: Dict[str, List[str]] = {}
+        
+        # Only send texts that are not memoized yet, each once
+        pending = []
+        for text in dict.fromkeys(texts):
+            cached = self._cache_get('unknown_terms_batch', 'unknown', text)
+            if cached is None:
+                pending.append(text)
+            else:
+                found[text] = cached
+        
+        for start in range(0, len(pending), self.UNKNOWN_TERMS_BATCH_SIZE):
+            chunk = pending[start:start + self.UNKNOWN_TERMS_BATCH_SIZE]
+            
+            try:
+                prompt = self.UNKNOWN_TERMS_BATCH_PROMPT.format(
+                    fortinet_terms=self._fortinet_terms_str,
+                    common_terms=self._COMMON_TERMS_STR,
+                    texts="\n".join(f"[S{i}] {text}" for i, text in enumerate(chunk, 1))
+                )
+                
+                result = self._complete(dict(
+                    model=self.MODEL,
+                    messages=[
+                        {"role": "system", "content": "You are a technical term analysis assistant."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0,
+                    max_tokens=60 * len(chunk)
+                ))
+                # Only positions with an answer line; the reply can be truncated
+                # or skip a text
+                chunk_terms: Dict[int, List[str]] = {}
+                
+                # Parse "S<n>: term, term" / "S<n>: CLEAR" lines
+                for line in result.splitlines():
+                    match = _BATCH_LINE_RE.match(line)
+                    if not match:
+                        continue
+                    
+                    pos = int(match.group(1)) - 1
+                    if not 0 <= pos < len(chunk):
+                        continue
+                    
+                    terms_str = match.group(2).strip()
+                    if terms_str.upper() == "CLEAR":
+                        chunk_terms[pos] = []
+                    else:
+                        chunk_terms[pos] = [t.strip() for t in _TERM_SPLIT.findall(terms_str)]
+                
+                for pos, text in enumerate(chunk):
+                    terms = chunk_terms.get(pos)
+                    if terms is None:
+                        # Unanswered: ask for this text on its own rather than
+                        # caching a guess of "no unknown terms"
+                        found[text] = self.detect_unknown_terms(text)
+                        continue
+                    
+                    self._cache_put('unknown_terms_batch', 'unknown', text, terms)
+                    found[text] = terms
+                    
+            except Exception as e:
+                log.warning("OpenAI Unknown Terms Batch Error: %s", e)
+        
+        return [list(found.get(text, [])) for text in texts]
 
 
 class HybridValidator:
     """Combines rule-based and AI validation."""
     
-    def __init__(self, openai_api_key: str, fortinet_shorthands: Dict[str, str]):
-        """Initialize hybrid validator."""
-        self.ai_validator = OpenAIValidator(openai_api_key, fortinet_shorthands)
+    # Upper bound on in-flight OpenAI requests during validate_all
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # validate_all mode -> key in OpenAIValidator.validate_all results
+    _CASE_KEYS = {'title': 'title_case', 'sentence': 'sentence_case'}
+    
+    def __init__(self, openai_api_key: str, fortinet_shorthands: Dict[str, str], **validator_options):
+        """Initialize hybrid validator (validator_options go to OpenAIValidator)."""
+        self.ai_validator = OpenAIValidator(openai_api_key, fortinet_shorthands, **validator_options)
         self.fortinet_shorthands = fortinet_shorthands
     
     def validate_title_case_hybrid(self, text: str, rule_based_result: Tuple[bool, str]) -> Dict:
@@ -315,33 +625,7 @@ class HybridValidator:
                 'final_recommendation': str
             }
         """
-        rule_valid, rule_corrected = rule_based_result
-        
-        # AI validation
-        ai_valid, ai_corrected, ai_explanation = self.ai_validator.validate_title_case(text)
-        
-        # Unknown terms detection
-        unknown_terms = self.ai_validator.detect_unknown_terms(text)
-        
-        # Check agreement
-        agreement = (rule_valid == ai_valid)
-        
-        # Final recommendation (prefer AI if disagreement)
-        if agreement:
-            final_recommendation = rule_corrected if not rule_valid else text
-        else:
-            final_recommendation = ai_corrected if not ai_valid else text
-        
-        return {
-            'rule_based_valid': rule_valid,
-            'rule_based_corrected': rule_corrected,
-            'ai_valid': ai_valid,
-            'ai_corrected': ai_corrected,
-            'ai_explanation': ai_explanation,
-            'unknown_terms': unknown_terms,
-            'agreement': agreement,
-            'final_recommendation': final_recommendation
-        }
+        return self.validate_all([('title', text, rule_based_result)])[0]
     
     def validate_sentence_case_hybrid(self, text: str, rule_based_result: Tuple[bool, str]) -> Dict:
         """
@@ -352,24 +636,61 @@ class HybridValidator:
             rule_based_result: (is_valid, corrected_text) from rule-based validator
             
         Returns:
-            {
-                'rule_based_valid': bool,
-                'rule_based_corrected': str,
-                'ai_valid': bool,
-                'ai_corrected': str,
-                'ai_explanation': str,
-                'unknown_terms': List[str],
-                'agreement': bool,
-                'final_recommendation': str
-            }
+            Same structure as validate_title_case_hybrid
         """
-        rule_valid, rule_corrected = rule_based_result
+        return self.validate_all([('sentence', text, rule_based_result)])[0]
+    
+    def validate_all(self, items: List[Tuple[str, str, Tuple[bool, str]]]) -> List[Dict]:
+        """
+        Run hybrid validation for many texts concurrently.
+        
+        Args:
+            items: (mode, text, rule_based_result) tuples, mode is 'title' or 'sentence'
+            
+        Returns:
+            Hybrid result dicts, aligned with `items`
+        """
+        if not items:
+            return []
+        
+        if self.ai_validator.backend != "openai":
+            # Local models run one request at a time; nothing to fan out over
+            ai_by_text = {}
+            for _, text, _ in items:
+                if text not in ai_by_text:
+                    ai_by_text[text] = self.ai_validator.validate_all(text)
+        else:
+            ai_by_text = asyncio.run(self._avalidate_all(items))
+        
+        return [
+            self._combine_results(
+                text, rule_based_result,
+                ai_by_text[text][self._CASE_KEYS[mode]], ai_by_text[text]['unknown_terms']
+            )
+            for mode, text, rule_based_result in items
+        ]
+    
+    async def _avalidate_all(self, items: List[Tuple[str, str, Tuple[bool, str]]]) -> Dict[str, Dict]:
+        """Fan out one combined check per distinct text over a pooled async client."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
         
-        # AI validation
-        ai_valid, ai_corrected, ai_explanation = self.ai_validator.validate_sentence_case(text)
+        # Both case modes of a text come from the same combined request
+        unique = list(dict.fromkeys(text for _, text, _ in items))
         
-        # Unknown terms detection
-        unknown_terms = self.ai_validator.detect_unknown_terms(text)
+        async def limited(client: AsyncOpenAI, text: str) -> Dict:
+            async with semaphore:
+                return await self.ai_validator.avalidate_all(client, text)
+        
+        async with AsyncOpenAI(api_key=self.ai_validator.api_key) as client:
+            ai_results = await asyncio.gather(*(limited(client, text) for text in unique))
+        
+        return dict(zip(unique, ai_results))
+    
+    def _combine_results(self, text: str, rule_based_result: Tuple[bool, str],
+                         ai_result: Tuple[bool, str, str], unknown_terms: List[str]) -> Dict:
+        """Merge rule-based and AI outcomes into a hybrid result dict."""
+        ai_valid, ai_corrected, ai_explanation = ai_result
+        rule_valid, rule_corrected = rule_based_result
         
         # Check agreement
         agreement = (rule_valid == ai_valid)
@@ -386,62 +707,7 @@ class HybridValidator:
             'ai_valid': ai_valid,
             'ai_corrected': ai_corrected,
             'ai_explanation': ai_explanation,
-            'unknown_terms': unknown_terms,
+            'unknown_terms': list(unknown_terms),
             'agreement': agreement,
             'final_recommendation': final_recommendation
         }
-    
-    def scan_all_unknown_terms(self, brief_data: Dict) -> Dict[str, List[str]]:
-        """
-        Scan entire brief for unknown terms.
-        
-        Returns:
-            {
-                'meta_title': [...],
-                'meta_description': [...],
-                'h1': [...],
-                ...
-            }
-        """
-        unknown_by_section = {}
-        
-        # Check all sections
-        sections = [
-            ('meta_title', brief_data.get('meta_title', '')),
-            ('meta_description', brief_data.get('meta_description', '')),
-            ('h1', brief_data.get('h1', '')),
-            ('header_caption', brief_data.get('header_caption', '')),
-        ]
-        
-        # Headers
-        for idx, header in enumerate(brief_data.get('headers', [])):
-            sections.append((f"{header['level']}_{idx}", header['text']))
-        
-        # FAQs
-        faqs = brief_data.get('faqs', {})
-        if faqs.get('header'):
-            sections.append(('faq_header', faqs['header']))
-        
-        for idx, faq in enumerate(faqs.get('questions', [])):
-            sections.append((f'faq_q_{idx}', faq['question']))
-            sections.append((f'faq_a_{idx}', faq['answer']))
-        
-        # Product Nav
-        for idx, tab in enumerate(brief_data.get('product_nav', {}).get('tabs', [])):
-            sections.append((f'nav_{idx}', tab['text']))
-        
-        # CTA
-        cta = brief_data.get('cta', {})
-        if cta.get('caption'):
-            sections.append(('cta_caption', cta['caption']))
-        if cta.get('text'):
-            sections.append(('cta_text', cta['text']))
-        
-        # Detect unknown terms in each section
-        for section_name, text in sections:
-            if text:
-                unknown = self.ai_validator.detect_unknown_terms(text)
-                if unknown:
-                    unknown_by_section[section_name] = unknown
-        
-        return unknown_by_section
\ No newline at end of file
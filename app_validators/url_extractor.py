@@ -3,101 +3,433 @@ URL Extractor Module
 No content extraction
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Any, List
+import codecs
+import hashlib
+import logging
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+# Elements whose strings are not page text (same set bs4's get_text skips)
+_NON_TEXT_TAGS = frozenset({'script', 'style', 'template'})
+
+
+def _iter_strings(el) -> Iterator[str]:
+    """Yield the text strings under an element in document order."""
+    # Comments/processing instructions have a non-string tag
+    if not isinstance(el.tag, str) or el.tag in _NON_TEXT_TAGS:
+        return
+    if el.text:
+        yield el.text
+    for child in el:
+        yield from _iter_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _text(el, separator: str = '') -> str:
+    """Stripped text of an element, like bs4's get_text(separator, strip=True)."""
+    # Most headings, paragraphs and links are a single text node
+    if not len(el) and el.tag not in _NON_TEXT_TAGS:
+        return el.text.strip() if el.text else ''
+    # itertext() walks the subtree in C and already skips comments; only a
+    # subtree holding script/style/template needs the Python walk
+    if next(el.iter(*_NON_TEXT_TAGS), None) is None:
+        strings = el.itertext()
+    else:
+        strings = _iter_strings(el)
+    return separator.join(
+        stripped for stripped in (s.strip() for s in strings) if stripped
+    )
+
+
+# Compiled once; each call is a single libxml2 evaluation
+_XP_TITLE = etree.XPath('string((//title)[1])')
+_XP_OG_TITLE = etree.XPath("string((//meta[@property='og:title'])[1]/@content)")
+_XP_META_TITLE = etree.XPath("string((//meta[@name='title'])[1]/@content)")
+_XP_META_DESC = etree.XPath("string((//meta[@name='description'])[1]/@content)")
+_XP_OG_DESC = etree.XPath("string((//meta[@property='og:description'])[1]/@content)")
+# Header caption candidates relative to the first H1, in priority order: the next
+# sibling <p>, the first <p> in the next sibling <div>, then the first <p> after
+# the H1's parent starts (its descendants included)
+_XP_CAPTION_CANDIDATES = tuple(etree.XPath(xpath) for xpath in (
+    'following-sibling::p[1]',
+    'following-sibling::div[1]/descendant::p[1]',
+    '(../descendant::p | ../following::p)[1]',
+))
+
+# Header level labels, shared by every header dict
+_LVL = {'h2': 'H2', 'h3': 'H3', 'h4': 'H4'}
+
+# Heading text that marks the FAQ section
+_FAQ_RE = re.compile(r'FAQ|FREQUENTLY ASKED', re.IGNORECASE)
+
+# Product nav candidates in priority order; class match is a case-insensitive 'nav' substring
+_XP_NAV_CANDIDATES = tuple(etree.XPath(xpath) for xpath in (
+    "(//nav[contains(translate(@class, 'NAV', 'nav'), 'nav')])[1]",
+    "(//div[contains(translate(@class, 'NAV', 'nav'), 'nav')])[1]",
+    "(//ul[contains(translate(@class, 'NAV', 'nav'), 'nav')])[1]",
+    "(//div[@role='navigation'])[1]",
+    "(//nav)[1]",
+))
+
+
+# Bodies are truncated past this size; every extracted field sits well inside it
+MAX_BYTES = 2_000_000
+CHUNK_SIZE = 32768
+
+
+def _header_encoding(response: requests.Response) -> Optional[str]:
+    """Charset from the Content-Type header, if it declares one."""
+    if 'charset=' in response.headers.get('content-type', '').lower():
+        return response.encoding
+    return None
+
+
+# Where the HTML encoding prescan looks for a declared charset
+SNIFF_BYTES = 1024
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([-\w.:]+)', re.IGNORECASE)
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def _sniff_encoding(content: bytes) -> str:
+    """Encoding from a BOM or a <meta> charset near the top of the page, else UTF-8."""
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+    
+    match = _META_CHARSET_RE.search(content, 0, SNIFF_BYTES)
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode('ascii')).name
+        except LookupError:
+            pass
+    
+    return 'utf-8'
+
+
+def _html_parser(encoding: Optional[str]) -> lxml_html.HTMLParser:
+    """HTML parser for fetched pages, decoding with the given charset."""
+    # Whitespace-only text never survives the stripped text helpers, and
+    # no extractor looks elements up by id, so build neither
+    return lxml_html.HTMLParser(
+        encoding=encoding,
+        remove_blank_text=True,
+        collect_ids=False
+    )
+
+
+def _read_capped(response: requests.Response) -> bytes:
+    """Read a streamed response body, stopping after MAX_BYTES."""
+    chunks = []
+    consumed = 0
+    
+    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+        chunk = chunk[:MAX_BYTES - consumed]
+        chunks.append(chunk)
+        consumed += len(chunk)
+        if consumed >= MAX_BYTES:
+            break
+    
+    return b''.join(chunks)
+
+
+def _build_session() -> requests.Session:
+    """Shared session so repeat fetches reuse pooled keep-alive connections."""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Connection': 'keep-alive',
+    })
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+# Entries kept by each of the fetch and parse caches; bodies can be up to
+# MAX_BYTES each, so keep this small for long-running processes
+CACHE_SIZE = 16
+
+# url -> (ETag, Last-Modified, body, encoding) of the last validated 200 response
+_FETCH_CACHE: 'OrderedDict[str, Tuple[Optional[str], Optional[str], bytes, str]]' = OrderedDict()
+# (sha1 of body, encoding) -> parsed tree; extractors only read the tree, so it is shared
+_TREE_CACHE: 'OrderedDict[Tuple[str, str], Any]' = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: OrderedDict, key):
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key, value) -> None:
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _fetch_cache_clear() -> None:
+    """Drop all cached responses and trees."""
+    with _cache_lock:
+        _FETCH_CACHE.clear()
+        _TREE_CACHE.clear()
+
+
+def _fetch(url: str) -> Tuple[int, bytes, str]:
+    """
+    Fetch a page, revalidating a cached copy with a conditional GET.
+    Returns the status code, the (capped) body and its encoding.
+    """
+    cached = _cache_get(_FETCH_CACHE, url)
+    headers = {}
+    if cached:
+        etag, last_modified = cached[0], cached[1]
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    response = _SESSION.get(url, headers=headers, stream=True, timeout=(5, 25), verify=True)
+    with response:
+        if cached and response.status_code == 304:
+            return response.status_code, cached[2], cached[3]
+        
+        response.raise_for_status()
+        content = _read_capped(response)
+    
+    encoding = _header_encoding(response) or _sniff_encoding(content)
+    
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        _cache_put(_FETCH_CACHE, url, (etag, last_modified, content, encoding))
+    
+    return response.status_code, content, encoding
+
+
+def _parse(content: bytes, encoding: str):
+    """Parse a page body, reusing the tree of an identical earlier body."""
+    key = (hashlib.sha1(content).hexdigest(), encoding)
+    tree = _cache_get(_TREE_CACHE, key)
+    if tree is None:
+        tree = lxml_html.document_fromstring(content, parser=_html_parser(encoding))
+        _cache_put(_TREE_CACHE, key, tree)
+    return tree
+
+
+@dataclass(slots=True)
+class Header:
+    """An H2/H3/H4 heading."""
+    level: str
+    text: str
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {'level': self.level, 'text': self.text}
+
+
+@dataclass(slots=True)
+class FAQQuestion:
+    """A question listed under the FAQ heading."""
+    question: str
+    answer: str = 'Answer extracted from webpage'
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {'question': self.question, 'answer': self.answer}
+
+
+@dataclass(slots=True)
+class FAQSection:
+    """The FAQ heading and its questions."""
+    header: str = ''
+    questions: List[FAQQuestion] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'header': self.header,
+            'questions': [question.to_dict() for question in self.questions]
+        }
+
+
+@dataclass(slots=True)
+class NavTab:
+    """A product navigation link."""
+    text: str
+    linked_section: str
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {'text': self.text, 'linked_section': self.linked_section}
+
+
+@dataclass(slots=True)
+class CTA:
+    """The call-to-action paragraphs before the FAQ section."""
+    caption: str = ''
+    text: str = ''
+    position: str = 'before_faq'
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {'caption': self.caption, 'text': self.text, 'position': self.position}
+
+
+@dataclass(slots=True)
+class BriefData:
+    """Everything extracted from a live page."""
+    url: str
+    meta_title: str = ''
+    meta_description: str = ''
+    h1: str = ''
+    header_caption: str = ''
+    headers: List[Header] = field(default_factory=list)
+    faqs: FAQSection = field(default_factory=FAQSection)
+    product_nav_tabs: List[NavTab] = field(default_factory=list)
+    cta: CTA = field(default_factory=CTA)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Same shape as DOCXExtractor.extract_brief_data(), as the validator expects."""
+        return {
+            'url': self.url,
+            'meta_title': self.meta_title,
+            'meta_description': self.meta_description,
+            'h1': self.h1,
+            'header_caption': self.header_caption,
+            'headers': [header.to_dict() for header in self.headers],
+            'faqs': self.faqs.to_dict(),
+            'product_nav': {
+                'tabs': [tab.to_dict() for tab in self.product_nav_tabs]
+            },
+            'cta': self.cta.to_dict()
+        }
 
 
 class URLExtractor:
     """Extracts and structures content from live URLs."""
     
+    # Default worker threads for extract_batch; fetches are network-bound
+    MAX_WORKERS = 16
+    
     def __init__(self, url: str):
         self.url = url
-        self.soup = None
+        self.tree = None
+        
+        # Filled by _scan()
+        self._h1s: List[Any] = []
+        self._headings: List[Tuple[str, str]] = []
+        self._paragraphs: List[Any] = []
+        self._faq_heading_pos: Optional[int] = None
+        self._faq_paragraph_count = 0
+    
+    @classmethod
+    def extract_batch(cls, urls: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract brief data for several URLs concurrently over the shared session.
+        Results are brief dicts in the same order as urls.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or cls.MAX_WORKERS) as pool:
+            return list(pool.map(lambda url: cls(url).extract_brief_data().to_dict(), urls))
         
-    def extract_brief_data(self) -> Dict[str, Any]:
+    def extract_brief_data(self) -> BriefData:
         """Extract all brief data from live URL."""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Connection': 'keep-alive',
-            }
-            response = requests.get(self.url, timeout=30, headers=headers, verify=True)
-            response.raise_for_status()
-            self.soup = BeautifulSoup(response.content, 'lxml')
+            status_code, content, encoding = _fetch(self.url)
+            self.tree = _parse(content, encoding)
             
-            print(f"DEBUG: HTTP Status: {response.status_code}")
-            print(f"DEBUG: Content Length: {len(response.content)}")
+            log.debug("HTTP Status: %s", status_code)
+            log.debug("Content Length: %d", len(content))
             
         except Exception as e:
             raise Exception(f"Failed to fetch URL: {str(e)}")
         
-        brief_data = {
-            'url': self.url,
-            'meta_title': '',
-            'meta_description': '',
-            'h1': '',
-            'header_caption': '',
-            'headers': [],
-            'faqs': {
-                'header': '',
-                'questions': []
-            },
-            'product_nav': {
-                'tabs': []
-            },
-            'cta': {
-                'caption': '',
-                'text': '',
-                'position': 'before_faq'
-            }
-        }
+        self._scan()
+        
+        brief_data = BriefData(url=self.url)
         
-        brief_data['meta_title'] = self._extract_meta_title()
-        brief_data['meta_description'] = self._extract_meta_description()
+        brief_data.meta_title = self._extract_meta_title()
+        brief_data.meta_description = self._extract_meta_description()
         
         h1, caption = self._extract_h1_and_caption()
-        brief_data['h1'] = h1
-        brief_data['header_caption'] = caption
+        brief_data.h1 = h1
+        brief_data.header_caption = caption
         
-        brief_data['headers'] = self._extract_headers()
-        brief_data['faqs'] = self._extract_faqs()
-        brief_data['product_nav']['tabs'] = self._extract_product_nav()
+        brief_data.headers = self._extract_headers()
+        brief_data.faqs = self._extract_faqs()
+        brief_data.product_nav_tabs = self._extract_product_nav()
         
         cta = self._extract_cta()
-        if cta and (cta.get('caption') or cta.get('text')):
-            brief_data['cta'] = cta
+        if cta.caption or cta.text:
+            brief_data.cta = cta
         
         return brief_data
     
+    def _scan(self) -> None:
+        """
+        Walk the tree once, collecting what the H1, heading, FAQ and CTA
+        extractors read, so none of them traverses the document again.
+        """
+        h1s = self._h1s = []
+        headings = self._headings = []      # (tag, text) of h2/h3/h4 in document order
+        paragraphs = self._paragraphs = []  # <p> elements in document order
+        self._faq_heading_pos = None        # index of the FAQ H2 in headings
+        self._faq_paragraph_count = 0       # <p> elements before the FAQ H2
+        
+        for el in self.tree.iter('h1', 'h2', 'h3', 'h4', 'p'):
+            tag = el.tag
+            if tag == 'p':
+                paragraphs.append(el)
+            elif tag == 'h1':
+                h1s.append(el)
+            else:
+                text = _text(el)
+                if tag == 'h2' and self._faq_heading_pos is None:
+                    if _FAQ_RE.search(text):
+                        self._faq_heading_pos = len(headings)
+                        self._faq_paragraph_count = len(paragraphs)
+                headings.append((tag, text))
+    
     def _extract_meta_title(self) -> str:
         """Extract meta title from page."""
-        title_tag = self.soup.find('title')
-        if title_tag and title_tag.string:
-            return title_tag.string.strip()
-        
-        meta_title = self.soup.find('meta', {'property': 'og:title'})
-        if meta_title and meta_title.get('content'):
-            return meta_title['content'].strip()
-        
-        meta_title = self.soup.find('meta', {'name': 'title'})
-        if meta_title and meta_title.get('content'):
-            return meta_title['content'].strip()
+        for xpath in (_XP_TITLE, _XP_OG_TITLE, _XP_META_TITLE):
+            value = xpath(self.tree)
+            if value:
+                return value.strip()
         
         return ''
     
     def _extract_meta_description(self) -> str:
         """Extract meta description from page."""
-        meta_desc = self.soup.find('meta', {'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc['content'].strip()
-        
-        og_desc = self.soup.find('meta', {'property': 'og:description'})
-        if og_desc and og_desc.get('content'):
-            return og_desc['content'].strip()
+        for xpath in (_XP_META_DESC, _XP_OG_DESC):
+            value = xpath(self.tree)
+            if value:
+                return value.strip()
         
         return ''
     
@@ -106,163 +438,100 @@ class URLExtractor:
         h1 = ''
         caption = ''
         
-        h1_tags = self.soup.find_all('h1')
+        h1_tags = self._h1s
         if h1_tags:
             for tag in h1_tags:
-                text = tag.get_text(strip=True)
+                text = _text(tag)
                 if text and len(text) > 5:
                     h1 = text
                     break
             
-            if h1 and h1_tags[0]:
+            if h1:
                 h1_tag = h1_tags[0]
                 
-                next_elem = h1_tag.find_next_sibling('p')
-                if next_elem:
-                    text = next_elem.get_text(strip=True)
-                    if 20 < len(text) < 500:
-                        caption = text
-                
-                if not caption:
-                    next_div = h1_tag.find_next_sibling('div')
-                    if next_div:
-                        p_tag = next_div.find('p')
-                        if p_tag:
-                            text = p_tag.get_text(strip=True)
-                            if 20 < len(text) < 500:
-                                caption = text
-                
-                if not caption:
-                    parent = h1_tag.parent
-                    if parent:
-                        next_p = parent.find_next('p')
-                        if next_p:
-                            text = next_p.get_text(strip=True)
-                            if 20 < len(text) < 500:
-                                caption = text
+                for xpath in _XP_CAPTION_CANDIDATES:
+                    found = xpath(h1_tag)
+                    if found:
+                        text = _text(found[0])
+                        if 20 < len(text) < 500:
+                            caption = text
+                            break
         
         return h1, caption
     
-    def _extract_headers(self) -> List[Dict[str, str]]:
+    def _iter_headers(self) -> Iterator[Header]:
+        """Yield headers (H2, H3, H4) in document order."""
+        for tag, text in self._headings:
+            if text:
+                yield Header(_LVL[tag], text)
+    
+    def _extract_headers(self) -> List[Header]:
         """Extract all headers (H2, H3, H4)."""
-        headers = []
-        
-        for tag in self.soup.find_all(['h2', 'h3', 'h4']):
-            text = tag.get_text(strip=True)
-            if text and len(text) > 0:
-                level = tag.name.upper()
-                headers.append({'level': level, 'text': text})
-        
-        return headers
+        return list(self._iter_headers())
     
-    def _extract_faqs(self) -> Dict[str, Any]:
+    def _extract_faqs(self) -> FAQSection:
         """Extract FAQ section."""
-        faqs = {
-            'header': '',
-            'questions': []
-        }
+        faqs = FAQSection()
         
-        for h2 in self.soup.find_all('h2'):
-            text = h2.get_text(strip=True)
-            if 'FAQ' in text.upper() or 'FREQUENTLY ASKED' in text.upper():
-                faqs['header'] = text
-                
-                current = h2
-                questions_found = 0
-                
-                while True:
-                    current = current.find_next(['h2', 'h3'])
-                    if not current:
-                        break
-                    if current.name == 'h2':
-                        break
-                    if current.name == 'h3':
-                        question = current.get_text(strip=True)
-                        if question and len(question) > 5:
-                            faqs['questions'].append({
-                                'question': question,
-                                'answer': 'Answer extracted from webpage'
-                            })
-                            questions_found += 1
-                
-                print(f"DEBUG: FAQ extraction - Found {questions_found} questions")
-                break
+        pos = self._faq_heading_pos
+        if pos is not None:
+            faqs.header = self._headings[pos][1]
+            
+            questions_found = 0
+            
+            for tag, question in self._headings[pos + 1:]:
+                if tag == 'h2':
+                    break
+                if tag == 'h3':
+                    if question and len(question) > 5:
+                        faqs.questions.append(FAQQuestion(question))
+                        questions_found += 1
+            
+            log.debug("FAQ extraction - Found %d questions", questions_found)
         
         return faqs
     
-    def _extract_product_nav(self) -> List[Dict[str, str]]:
+    def _extract_product_nav(self) -> List[NavTab]:
         """Extract Product Navigation tabs from webpage."""
         tabs = []
         
-        nav_selectors = [
-            ('nav', {'class': re.compile(r'.*nav.*', re.I)}),
-            ('div', {'class': re.compile(r'.*nav.*', re.I)}),
-            ('ul', {'class': re.compile(r'.*nav.*', re.I)}),
-            ('div', {'role': 'navigation'}),
-            ('nav', {}),
-        ]
-        
-        for tag_name, attrs in nav_selectors:
-            nav = self.soup.find(tag_name, attrs)
-            if nav:
-                links = nav.find_all('a')
+        for xpath in _XP_NAV_CANDIDATES:
+            found = xpath(self.tree)
+            if found:
+                links = found[0].iter('a')
                 for link in links:
-                    text = link.get_text(strip=True)
+                    text = _text(link)
                     href = link.get('href', '')
                     if text and len(text) > 0:
-                        tabs.append({
-                            'text': text,
-                            'linked_section': href
-                        })
+                        tabs.append(NavTab(text, href))
                 
                 if tabs:
-                    print(f"DEBUG: Found {len(tabs)} nav tabs")
+                    log.debug("Found %d nav tabs", len(tabs))
                     break
         
         return tabs
     
-    def _extract_cta(self) -> Dict[str, str]:
+    def _extract_cta(self) -> CTA:
         """Extract CTA section - paragraphs before FAQ."""
-        cta = {
-            'caption': '',
-            'text': '',
-            'position': 'before_faq'
-        }
-        
-        faq_h2 = None
-        for h2 in self.soup.find_all('h2'):
-            text = h2.get_text(strip=True)
-            if 'FAQ' in text.upper() or 'FREQUENTLY ASKED' in text.upper():
-                faq_h2 = h2
-                break
+        cta = CTA()
         
-        if faq_h2:
-            all_elements = self.soup.find_all(['p', 'h2'])
-            faq_position = None
+        if self._faq_heading_pos is not None:
+            paragraphs_before_faq = []
             
-            for idx, elem in enumerate(all_elements):
-                if elem == faq_h2:
-                    faq_position = idx
-                    break
+            for elem in self._paragraphs[:self._faq_paragraph_count]:
+                text = _text(elem, " ")
+                if 20 < len(text) < 500:
+                    if '?' not in text or text.count('?') <= 1:
+                        paragraphs_before_faq.append(text)
             
-            if faq_position is not None:
-                paragraphs_before_faq = []
-                
-                for elem in all_elements[:faq_position]:
-                    if elem.name == 'p':
-                        text = elem.get_text(" ", strip=True)
-                        if 20 < len(text) < 500:
-                            if '?' not in text or text.count('?') <= 1:
-                                paragraphs_before_faq.append(text)
+            if len(paragraphs_before_faq) > 0:
+                cta_candidates = paragraphs_before_faq[-2:] if len(paragraphs_before_faq) >= 2 else paragraphs_before_faq[-1:]
                 
-                if len(paragraphs_before_faq) > 0:
-                    cta_candidates = paragraphs_before_faq[-2:] if len(paragraphs_before_faq) >= 2 else paragraphs_before_faq[-1:]
-                    
-                    if len(cta_candidates) >= 2:
-                        cta['caption'] = cta_candidates[0]
-                        cta['text'] = cta_candidates[1]
-                    elif len(cta_candidates) == 1:
-                        cta['text'] = cta_candidates[0]
-                        cta['caption'] = ''
+                if len(cta_candidates) >= 2:
+                    cta.caption = cta_candidates[0]
+                    cta.text = cta_candidates[1]
+                elif len(cta_candidates) == 1:
+                    cta.text = cta_candidates[0]
+                    cta.caption = ''
         
         return cta
\ No newline at end of file
@@ -4,18 +4,74 @@ This validator actually calls OpenAI API when enabled
 """
 
 from enum import Enum
-from dataclasses import dataclass
+import functools
+import logging
+import math
+import os
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from itertools import zip_longest
 from typing import List, Dict, Any, Optional
 import re
-import pandas as pd
 
-# Import hybrid validator
-try:
-    from app_validators.openai_validator import HybridValidator
-    HYBRID_AVAILABLE = True
-except ImportError:
-    HYBRID_AVAILABLE = False
-    print("⚠ HybridValidator not found - using rule-based only")
+log = logging.getLogger(__name__)
+
+
+def _import_hybrid_validator():
+    """
+    Import HybridValidator on first use, so rule-only reviews never load
+    the OpenAI SDK. Returns None if the module is unavailable.
+    """
+    try:
+        from app_validators.openai_validator import HybridValidator
+    except ImportError:
+        log.warning("HybridValidator not found - using rule-based only")
+        return None
+    return HybridValidator
+
+
+# Compiled once at import; the case validators run these per word
+# Brackets and '?' around a term are not word characters, so leaving them out of
+# the match finds the same terms and they pass through untouched
+_SHORTHAND_RE = re.compile(r'\b[a-zA-Z\-]+\b')
+# Shorthand tokens need an ASCII letter; text without one is returned as is
+_NEEDS_NORM_RE = re.compile(r'[A-Za-z]')
+_CLEAN_WORD_RE = re.compile(r'[^\w\-]')
+_TITLE_WORD_RE = re.compile(r'^([(\[]?)([\w\-]+)([)\]?,?\?]*)$')
+_SENT_PUNCT_RE = re.compile(r'[.!?;:]')
+_WORD_RE = re.compile(r'\S+')
+
+# Pattern: Word boundary + Capital letter + lowercase letters + lowercase 's' + word boundary
+# This catches: Vpns, Apis, Urls, Sdks, Vms, Ips, Faqs, etc.
+_ACRONYM_FIX_MAP = {
+    'Vpns': 'VPNs',
+    'Apis': 'APIs',
+    'Urls': 'URLs',
+    'Sdks': 'SDKs',
+    'Vms': 'VMs',
+    'Ips': 'IPs',
+    'Ids': 'IDs',
+    'Faqs': 'FAQs',
+    'Pdfs': 'PDFs',
+    'Csvs': 'CSVs',
+    'Slas': 'SLAs',
+    'Kpis': 'KPIs',
+}
+def _capitalize(word: str) -> str:
+    """First character upper-cased, the rest lower-cased."""
+    # str.capitalize() runs in one C call but title-cases the first character,
+    # which differs from upper() only outside ASCII (e.g. digraphs, 'ß')
+    if word.isascii():
+        return word.capitalize()
+    return word[0].upper() + word[1:].lower() if len(word) > 1 else word.upper()
+
+
+# One alternation, so the text is scanned once rather than once per acronym
+_ACRONYM_RE = re.compile(r'\b(' + '|'.join(_ACRONYM_FIX_MAP) + r')\b')
+
+
+def _acronym_repl(match) -> str:
+    return _ACRONYM_FIX_MAP[match.group(1)]
 
 
 class Status(Enum):
@@ -24,7 +80,7 @@ class Status(Enum):
     REJECTED = "✗ REJECTED"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Stores a single validation result."""
     use_case: str
@@ -36,7 +92,18 @@ class ValidationResult:
     # Hybrid fields
     ai_validated: bool = False
     ai_result: str = ""
-    unknown_terms: List[str] = None
+    unknown_terms: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _HybridCheck:
+    """An AI check queued by a field validator; review_brief sends them in one batch."""
+    mode: str
+    text: str
+    rule_result: tuple[bool, str]
+    # build(text, rule_result, hybrid_result) -> ValidationResult; hybrid_result
+    # is None if the AI call failed
+    build: Any
 
 
 class AEMBriefReviewer:
@@ -94,109 +161,159 @@ class AEMBriefReviewer:
         # APIs
         "api": "API", "apis": "APIs"
     }
+    
+    # Minor words kept lowercase inside a Title Case string
+    TITLE_LOWERCASE_WORDS = frozenset({'a', 'an', 'the', 'and', 'but', 'or', 'nor', 'in', 'of', 'to',
+                                       'for', 'at', 'by', 'on', 'with', 'from', 'into'})
+    
+    # Category of every use case the validators emit (what the substring
+    # rules in _get_category give for them; "FAQ H2 Header" matches 'H2' first)
+    _USE_CASE_CATEGORY = {
+        'Meta Title': 'Metadata',
+        'Meta Description': 'Metadata',
+        'H1': 'Headers',
+        'Header Caption': 'Headers',
+        'H2': 'Headers',
+        'H3': 'Headers',
+        'H4': 'Headers',
+        'FAQ H2 Header': 'Headers',
+        'FAQ Question': 'FAQ',
+        'FAQ Answer': 'FAQ',
+        'Product Nav Tab': 'Navigation',
+        'CTA Text': 'CTA',
+    }
+    
+    # Memoised results kept per case rule (see __init__)
+    TEXT_CACHE_SIZE = 4096
 
-    def __init__(self, openai_api_key: Optional[str] = None):
-        """Initialize validator with optional OpenAI support."""
-        self.results: List[ValidationResult] = []
-        self.unknown_terms_report: Dict[str, List[str]] = {}
+    def __init__(self, openai_api_key: Optional[str] = None, ai_backend: Optional[str] = None):
+        """
+        Initialize validator with optional AI support.
+        
+        ai_backend is 'openai' or 'llama_cpp' (defaults to the AI_BACKEND
+        environment variable); the local llama_cpp backend needs no API key.
+        """
+        # Shorthands the normalizer can rewrite: every Forti* word is kept as
+        # written, so those keys can never apply
+        self._normalize_lookup = {
+            term: shorthand for term, shorthand in self.FORTINET_SHORTHANDS.items()
+            if not term.startswith('forti')
+        }.get
+        
+        # The case rules are pure text -> result functions, and briefs repeat
+        # strings ("Learn more", "Overview") across fields and reruns
+        memoize = functools.lru_cache(maxsize=self.TEXT_CACHE_SIZE)
+        self._normalize_fortinet_shorthands = memoize(self._normalize_fortinet_shorthands)
+        self._validate_capital_case = memoize(self._validate_capital_case)
+        self._validate_title_case = memoize(self._validate_title_case)
+        self._validate_sentence_case = memoize(self._validate_sentence_case)
+        
+        # Header level -> validator, used by review_brief
+        self._header_dispatch = {
+            'H2': self._validate_h2,
+            'H3': self._validate_h3,
+            'H4': self._validate_h4,
+        }
         
         # Initialize hybrid validator
-        if openai_api_key and HYBRID_AVAILABLE:
+        ai_backend = ai_backend or os.getenv("AI_BACKEND") or "openai"
+        use_ai = bool(openai_api_key) or ai_backend == "llama_cpp"
+        hybrid_validator_cls = _import_hybrid_validator() if use_ai else None
+        if hybrid_validator_cls is not None:
             try:
-                self.hybrid_validator = HybridValidator(openai_api_key, self.FORTINET_SHORTHANDS)
-                print("✓ Hybrid validation ENABLED (OpenAI API will be called)")
+                self.hybrid_validator = hybrid_validator_cls(
+                    openai_api_key, self.FORTINET_SHORTHANDS, backend=ai_backend
+                )
+                log.info("Hybrid validation ENABLED (%s backend will be called)", ai_backend)
             except Exception as e:
                 self.hybrid_validator = None
-                print(f"✗ Hybrid validation failed to initialize: {e}")
+                log.warning("Hybrid validation failed to initialize: %s", e)
         else:
             self.hybrid_validator = None
-            if not HYBRID_AVAILABLE:
-                print("⚠ HybridValidator module not found")
-            elif not openai_api_key:
-                print("⚠ No OpenAI API key provided")
+            # A missing HybridValidator module is already logged by _import_hybrid_validator
+            if not use_ai:
+                log.info("No OpenAI API key provided")
     def _normalize_fortinet_shorthands(self, text: str) -> str:
         """Normalize Fortinet-approved shorthands and preserve Forti* products."""
-        if not text:
+        if not text or not _NEEDS_NORM_RE.search(text):
             return text
     
+        lookup = self._normalize_lookup
 
         def replace(match):
-            prefix = match.group(1) or ""
-            core = match.group(2)
-            suffix = match.group(3) or ""
-            
-            # ✅ PRESERVE ALL FORTINET PRODUCTS (FortiCNAPP, FortiDevOps, etc.)
-            if core.lower().startswith('forti'):
-                # Keep exact casing for Fortinet products
-                return match.group(0)
-            
-            # Check dictionary for other terms
-            core_lower = core.lower()
-            return f"{prefix}{self.FORTINET_SHORTHANDS.get(core_lower, core)}{suffix}"
+            # ✅ PRESERVE ALL FORTINET PRODUCTS (FortiCNAPP, FortiDevOps, etc.):
+            # Forti* words are not in the lookup, so they keep their casing
+            word = match.group()
+            return lookup(word.lower(), word)
 
-        pattern = r'(\()?(\b[a-zA-Z\-]+\b)(\)?\??)'
-        return re.sub(pattern, replace, text)            
+        return _SHORTHAND_RE.sub(replace, text)
         
     def _fix_acronym_plurals_rule_based(self, text: str) -> str:
         """Fix common acronym plural mistakes in rule-based validation."""
-        import re
-        
-        # Pattern: Word boundary + Capital letter + lowercase letters + lowercase 's' + word boundary
-        # This catches: Vpns, Apis, Urls, Sdks, Vms, Ips, Faqs, etc.
-        acronym_fixes = {
-            r'\bVpns\b': 'VPNs',
-            r'\bApis\b': 'APIs', 
-            r'\bUrls\b': 'URLs',
-            r'\bSdks\b': 'SDKs',
-            r'\bVms\b': 'VMs',
-            r'\bIps\b': 'IPs',
-            r'\bIds\b': 'IDs',
-            r'\bFaqs\b': 'FAQs',
-            r'\bPdfs\b': 'PDFs',
-            r'\bCsvs\b': 'CSVs',
-            r'\bSlas\b': 'SLAs',
-            r'\bKpis\b': 'KPIs',
-        }
-        
-        for pattern, replacement in acronym_fixes.items():
-            text = re.sub(pattern, replacement, text)
-        
-        return text
+        return _ACRONYM_RE.sub(_acronym_repl, text)
 
     def review_brief(self, brief_data: Dict[str, Any]) -> List[ValidationResult]:
         """Main validation with hybrid support."""
-        self.results = []
-        self.unknown_terms_report = {}
-        
-        self._validate_meta_title(brief_data.get('meta_title', ''))
-        self._validate_meta_description(brief_data.get('meta_description', ''))
-        self._validate_h1(brief_data.get('h1', ''))
-        self._validate_header_caption(brief_data.get('header_caption', ''))
-        
-        for header in brief_data.get('headers', []):
-            if header['level'] == 'H2':
-                self._validate_h2(header['text'])
-            elif header['level'] == 'H3':
-                self._validate_h3(header['text'])
-            elif header['level'] == 'H4':
-                self._validate_h4(header['text'])
+        # Results and queued AI checks live in this call only, so one reviewer
+        # can serve concurrent sessions
+        results: List[Optional[ValidationResult]] = []
+        pending: List[tuple[int, _HybridCheck]] = []
+        
+        for item in self._review_fields(brief_data):
+            if isinstance(item, _HybridCheck):
+                # Reserve the slot so results keep brief order
+                pending.append((len(results), item))
+                results.append(None)
+            else:
+                results.append(item)
+        
+        self._run_hybrid_batch(results, pending)
+        return results
+    
+    def _review_fields(self, brief_data: Dict[str, Any]):
+        """Validate every field of the brief, yielding results or queued AI checks."""
+        yield self._validate_meta_title(brief_data.get('meta_title', ''))
+        yield self._validate_meta_description(brief_data.get('meta_description', ''))
+        yield self._validate_h1(brief_data.get('h1', ''))
+        yield self._validate_header_caption(brief_data.get('header_caption', ''))
+        
+        header_dispatch = self._header_dispatch
+        for header in brief_data.get('headers', ()):
+            validate = header_dispatch.get(header['level'])
+            if validate is not None:
+                yield validate(header['text'])
         
         faqs = brief_data.get('faqs', {})
         if faqs.get('header'):
-            self._validate_faq_header(faqs['header'])
+            yield self._validate_faq_header(faqs['header'])
         
-        for faq in faqs.get('questions', []):
-            self._validate_faq_question(faq['question'])
-            self._validate_faq_answer(faq['answer'])
+        for faq in faqs.get('questions', ()):
+            yield self._validate_faq_question(faq['question'])
+            yield self._validate_faq_answer(faq['answer'])
         
-        for tab in brief_data.get('product_nav', {}).get('tabs', []):
-            self._validate_product_nav_tab(tab['text'])
+        for tab in brief_data.get('product_nav', {}).get('tabs', ()):
+            yield self._validate_product_nav_tab(tab['text'])
         
         cta = brief_data.get('cta', {})
         if cta.get('text'):
-            self._validate_cta_text(cta['text'])
-        
-        return self.results
+            yield self._validate_cta_text(cta['text'])
+    
+    def _run_hybrid_batch(self, results: List[Optional[ValidationResult]],
+                          pending: List[tuple[int, _HybridCheck]]):
+        """Send all queued AI checks in one concurrent batch and fill their slots."""
+        if not pending:
+            return
+        
+        try:
+            hybrid_results = self.hybrid_validator.validate_all(
+                [(check.mode, check.text, check.rule_result) for _, check in pending]
+            )
+        except Exception as e:
+            log.warning("OpenAI API call failed: %s", e)
+            hybrid_results = [None] * len(pending)
+        
+        for (slot, check), hybrid_result in zip(pending, hybrid_results):
+            results[slot] = check.build(check.text, check.rule_result, hybrid_result)
     
     def _validate_capital_case(self, text: str) -> tuple[bool, str]:
         """Capital Case: Every word capitalized."""
@@ -207,17 +324,18 @@ class AEMBriefReviewer:
         corrected_words = []
         
         for word in words:
-            clean_word = re.sub(r'[^\w\-]', '', word)
+            clean_word = word if word.isalnum() else _CLEAN_WORD_RE.sub('', word)
             if clean_word.lower().startswith('forti'):
                 # Preserve exact casing for all Forti* products
                 corrected_words.append(word)
                 continue
         
+            word_lower = word.lower()
             if word.isupper() and len(word) > 1:
                 corrected_words.append(word)
-            elif word.lower() == 'faqs':
+            elif word_lower == 'faqs':
                 corrected_words.append('FAQs')
-            elif word.lower() == 'vs':
+            elif word_lower == 'vs':
                 corrected_words.append('Vs')
              #  GENERIC RULE: Capitalize ALL parts of hyphenated words
             elif '-' in clean_word:
@@ -228,11 +346,9 @@ class AEMBriefReviewer:
                 corrected_words.append('-'.join(capitalized_parts))
                 continue    
             else:
-                corrected = word[0].upper() + word[1:].lower() if len(word) > 1 else word.upper()
-                corrected_words.append(corrected)
+                corrected_words.append(_capitalize(word))
         
-        corrected_text = ' '.join(corrected_words)
-        corrected_text = self._fix_acronym_plurals_rule_based(corrected_text)
+        corrected_text = self._fix_acronym_plurals_rule_based(' '.join(corrected_words))
         return (text == corrected_text), corrected_text
     
     def _validate_title_case(self, text: str) -> tuple[bool, str]:
@@ -240,18 +356,19 @@ class AEMBriefReviewer:
         if not text:
             return True, ""
         
-        lowercase_words = {'a', 'an', 'the', 'and', 'but', 'or', 'nor', 'in', 'of', 'to', 
-                          'for', 'at', 'by', 'on', 'with', 'from', 'into'}
+        lowercase_words = self.TITLE_LOWERCASE_WORDS
+        lookup = self.FORTINET_SHORTHANDS.get
         
         words = text.split()
         corrected_words = []
+        last = len(words) - 1
         
         for i, word in enumerate(words):
             is_first = (i == 0)
-            is_last = (i == len(words) - 1)
+            is_last = (i == last)
             
             # Check for Fortinet terms
-            match = re.match(r'^([(\[]?)([\w\-]+)([)\]?,?\?]*)$', word)
+            match = _TITLE_WORD_RE.match(word)
             if match:
                 prefix, core, suffix = match.groups()
                 core_lower = core.lower()
@@ -260,28 +377,28 @@ class AEMBriefReviewer:
                     corrected_words.append(word)
                     continue
                 
-                if core_lower in self.FORTINET_SHORTHANDS:
-                    corrected = f"{prefix}{self.FORTINET_SHORTHANDS[core_lower]}{suffix}"
-                    corrected_words.append(corrected)
+                shorthand = lookup(core_lower)
+                if shorthand is not None:
+                    corrected_words.append(f"{prefix}{shorthand}{suffix}")
                     continue
             
+            word_lower = word.lower()
             if word.isupper() and len(word) > 1:
                 corrected_words.append(word)
-            elif word.lower() == 'faqs':
+            elif word_lower == 'faqs':
                 corrected_words.append('FAQs')
-            elif word.lower() == 'vs':
+            elif word_lower == 'vs':
                 corrected = 'Vs' if (is_first or is_last) else 'vs'
                 corrected_words.append(corrected)
             else:
-                word_lower = re.sub(r'[.!?;:]', '', word.lower())
-                if word_lower in lowercase_words and not is_first and not is_last:
-                    corrected = word_lower
+                bare_lower = _SENT_PUNCT_RE.sub('', word_lower)
+                if bare_lower in lowercase_words and not is_first and not is_last:
+                    corrected = bare_lower
                 else:
-                    corrected = word[0].upper() + word[1:].lower() if len(word) > 1 else word.upper()
+                    corrected = _capitalize(word)
                 corrected_words.append(corrected)
         
-        corrected_text = ' '.join(corrected_words)
-        corrected_text = self._fix_acronym_plurals_rule_based(corrected_text)
+        corrected_text = self._fix_acronym_plurals_rule_based(' '.join(corrected_words))
         return (text == corrected_text), corrected_text
     
     def _validate_sentence_case(self, text: str) -> tuple[bool, str]:
@@ -289,29 +406,32 @@ class AEMBriefReviewer:
         if not text:
             return True, ""
         
-        words = text.split()
+        lookup = self.FORTINET_SHORTHANDS.get
         corrected_words = []
         sentence_start = True
         
-        for word in words:
-            clean_word = re.sub(r'[^\w\-]', '', word)
+        for word in text.split():
+            # Words of letters/digits only are already clean (\w is alnum or '_')
+            clean_word = word if word.isalnum() else _CLEAN_WORD_RE.sub('', word)
+            clean_lower = clean_word.lower()
+            ends_sentence = word[-1] in '.!?'
             
             # Check Fortinet terms
-            if clean_word.lower().startswith('forti'):
+            if clean_lower.startswith('forti'):
                 # Preserve exact casing for all Forti* products
                 corrected_words.append(word)
-                sentence_start = word.rstrip().endswith(('.', '!', '?'))
+                sentence_start = ends_sentence
                 continue
             
             # Check Fortinet terms dictionary
-            if clean_word.lower() in self.FORTINET_SHORTHANDS:
-                corrected = self.FORTINET_SHORTHANDS[clean_word.lower()]
+            corrected = lookup(clean_lower)
+            if corrected is not None:
                 if word != clean_word:
                     prefix = word[:word.index(clean_word[0])] if clean_word[0] in word else ''
                     suffix = word[word.index(clean_word[-1])+1:] if clean_word[-1] in word and word.index(clean_word[-1]) < len(word)-1 else ''
                     corrected = prefix + corrected + suffix
                 corrected_words.append(corrected)
-                sentence_start = word.rstrip().endswith(('.', '!', '?'))
+                sentence_start = ends_sentence
                 continue
 
             
@@ -323,29 +443,29 @@ class AEMBriefReviewer:
             
             # Sentence start - capitalize first letter
             if sentence_start:
-                if len(word) > 0 and word[0].islower():
+                if word[0].islower():
                     corrected = word[0].upper() + word[1:]
                     corrected_words.append(corrected)
                 else:
                     corrected_words.append(word)
-                sentence_start = word.rstrip().endswith(('.', '!', '?'))
+                sentence_start = ends_sentence
                 continue
             # ✅ Preserve technical camelCase or mixed case words (GraphQL, RESTful, API-first)
             elif any(c.isupper() for c in clean_word[1:]):
                 corrected_words.append(word)
-                sentence_start = word.rstrip().endswith(('.', '!', '?'))
+                sentence_start = ends_sentence
                 continue
             
             # Lowercase any uppercase words (except abbreviations)
-            has_caps = any(c.isupper() for c in clean_word)
+            has_caps = clean_word[:1].isupper()
             if has_caps:
                 prefix = ''
                 suffix = ''
                 core = clean_word
                 
                 if word != clean_word:
-                    start_idx = word.find(clean_word[0]) if clean_word else 0
-                    end_idx = word.rfind(clean_word[-1]) if clean_word else len(word)
+                    start_idx = word.find(clean_word[0])
+                    end_idx = word.rfind(clean_word[-1])
                     prefix = word[:start_idx]
                     suffix = word[end_idx+1:]
                     core = word[start_idx:end_idx+1]
@@ -356,10 +476,9 @@ class AEMBriefReviewer:
             else:
                 corrected_words.append(word)
             
-            sentence_start = word.rstrip().endswith(('.', '!', '?'))
+            sentence_start = ends_sentence
         
-        corrected_text = ' '.join(corrected_words)
-        corrected_text = self._fix_acronym_plurals_rule_based(corrected_text)
+        corrected_text = self._fix_acronym_plurals_rule_based(' '.join(corrected_words))
         return (text == corrected_text), corrected_text
     
     # === VALIDATION METHODS WITH HYBRID SUPPORT ===
@@ -367,206 +486,216 @@ class AEMBriefReviewer:
     def _validate_meta_title(self, text: str):
         """Validate meta title - USES OPENAI IF ENABLED."""
         text = self._normalize_fortinet_shorthands(text)
-        rule_valid, rule_corrected = self._validate_title_case(text)
+        rule_result = self._validate_title_case(text)
         
         # Call OpenAI if available
         if self.hybrid_validator:
-            print(f"🤖 Calling OpenAI API for Meta Title...")
-            try:
-                hybrid_result = self.hybrid_validator.validate_title_case_hybrid(
-                    text, (rule_valid, rule_corrected)
-                )
-                
-                final_valid = hybrid_result['ai_valid']
-                final_corrected = hybrid_result['final_recommendation']
-                if text.strip() == final_corrected.strip().strip('"').strip("'"):
-                    final_valid = True
-                
-                self.results.append(ValidationResult(
-                    "Meta Title", "Title Case", text,
-                    Status.ACCEPTED if final_valid else Status.REJECTED,
-                    f'"{final_corrected}"', "Metadata",
-                    ai_validated=True,
-                    ai_result=hybrid_result['ai_corrected'],
-                    unknown_terms=hybrid_result['unknown_terms']
-                ))
-                return
-            except Exception as e:
-                print(f"✗ OpenAI API call failed: {e}")
+            log.debug("Calling OpenAI API for Meta Title...")
+            return _HybridCheck('title', text, rule_result, self._meta_title_result)
+        
+        return self._meta_title_result(text, rule_result, None)
+    
+    def _meta_title_result(self, text: str, rule_result: tuple[bool, str],
+                           hybrid_result: Optional[Dict]) -> ValidationResult:
+        """Meta title result from the AI check, or from the rules if it failed."""
+        rule_valid, rule_corrected = rule_result
+        
+        if hybrid_result is not None:
+            final_valid = hybrid_result['ai_valid']
+            final_corrected = hybrid_result['final_recommendation']
+            if text.strip() == final_corrected.strip().strip('"').strip("'"):
+                final_valid = True
+            
+            return ValidationResult(
+                "Meta Title", "Title Case", text,
+                Status.ACCEPTED if final_valid else Status.REJECTED,
+                f'"{final_corrected}"', "Metadata",
+                ai_validated=True,
+                ai_result=hybrid_result['ai_corrected'],
+                unknown_terms=hybrid_result['unknown_terms']
+            )
         
         if text.strip() == rule_corrected.strip():
             rule_valid = True
             # Fallback to rule-based
-        self.results.append(ValidationResult(
+        return ValidationResult(
             "Meta Title", "Title Case", text,
             Status.ACCEPTED if rule_valid else Status.REJECTED,
             f'"{rule_corrected}"', "Metadata"
-        ))
+        )
     
     def _validate_meta_description(self, text: str):
         """Validate meta description - USES OPENAI IF ENABLED."""
         text = self._normalize_fortinet_shorthands(text)
-        rule_valid, rule_corrected = self._validate_sentence_case(text)
+        rule_result = self._validate_sentence_case(text)
         
         if self.hybrid_validator:
-            print(f"🤖 Calling OpenAI API for Meta Description...")
-            try:
-                hybrid_result = self.hybrid_validator.validate_sentence_case_hybrid(
-                    text, (rule_valid, rule_corrected)
-                )
-                
-                final_valid = hybrid_result['ai_valid']
-                final_corrected = hybrid_result['final_recommendation']
-                
-                self.results.append(ValidationResult(
-                    "Meta Description", "Sentence case", text,
-                    Status.ACCEPTED if final_valid else Status.REJECTED,
-                    f'"{final_corrected}"', "Metadata",
-                    ai_validated=True,
-                    ai_result=hybrid_result['ai_corrected'],
-                    unknown_terms=hybrid_result['unknown_terms']
-                ))
-                return
-            except Exception as e:
-                print(f"✗ OpenAI API call failed: {e}")
+            log.debug("Calling OpenAI API for Meta Description...")
+            return _HybridCheck('sentence', text, rule_result, self._meta_description_result)
         
-        self.results.append(ValidationResult(
+        return self._meta_description_result(text, rule_result, None)
+    
+    def _meta_description_result(self, text: str, rule_result: tuple[bool, str],
+                                 hybrid_result: Optional[Dict]) -> ValidationResult:
+        """Meta description result from the AI check, or from the rules if it failed."""
+        rule_valid, rule_corrected = rule_result
+        
+        if hybrid_result is not None:
+            final_valid = hybrid_result['ai_valid']
+            final_corrected = hybrid_result['final_recommendation']
+            
+            return ValidationResult(
+                "Meta Description", "Sentence case", text,
+                Status.ACCEPTED if final_valid else Status.REJECTED,
+                f'"{final_corrected}"', "Metadata",
+                ai_validated=True,
+                ai_result=hybrid_result['ai_corrected'],
+                unknown_terms=hybrid_result['unknown_terms']
+            )
+        
+        return ValidationResult(
             "Meta Description", "Sentence case", text,
             Status.ACCEPTED if rule_valid else Status.REJECTED,
             f'"{rule_corrected}"', "Metadata"
-        ))
+        )
     
     def _validate_h1(self, text: str):
         text = self._normalize_fortinet_shorthands(text)
         is_valid, corrected = self._validate_capital_case(text)
-        self.results.append(ValidationResult("H1", "Capital Case", text,
-                                             Status.ACCEPTED if is_valid else Status.REJECTED,
-                                             f'"{corrected}"', "Metadata"))
+        return ValidationResult("H1", "Capital Case", text,
+                                Status.ACCEPTED if is_valid else Status.REJECTED,
+                                f'"{corrected}"', "Metadata")
     
     def _validate_header_caption(self, text: str):
         text = self._normalize_fortinet_shorthands(text)
         is_valid, corrected = self._validate_sentence_case(text)
-        self.results.append(ValidationResult("Header Caption", "Sentence case", text,
-                                             Status.ACCEPTED if is_valid else Status.REJECTED,
-                                             f'"{corrected}"', "Metadata"))
+        return ValidationResult("Header Caption", "Sentence case", text,
+                                Status.ACCEPTED if is_valid else Status.REJECTED,
+                                f'"{corrected}"', "Metadata")
     
     def _validate_h2(self, text: str):
         text = self._normalize_fortinet_shorthands(text)
         is_valid, corrected = self._validate_capital_case(text)
-        self.results.append(ValidationResult("H2", "Capital Case", text,
-                                             Status.ACCEPTED if is_valid else Status.REJECTED,
-                                             f'"{corrected}"', "Headers"))
+        return ValidationResult("H2", "Capital Case", text,
+                                Status.ACCEPTED if is_valid else Status.REJECTED,
+                                f'"{corrected}"', "Headers")
     
     def _validate_h3(self, text: str):
         text = self._normalize_fortinet_shorthands(text)
         is_valid, corrected = self._validate_sentence_case(text)
-        self.results.append(ValidationResult("H3", "Sentence case", text,
-                                             Status.ACCEPTED if is_valid else Status.REJECTED,
-                                             f'"{corrected}"', "Headers"))
+        return ValidationResult("H3", "Sentence case", text,
+                                Status.ACCEPTED if is_valid else Status.REJECTED,
+                                f'"{corrected}"', "Headers")
     
     def _validate_h4(self, text: str):
         text = self._normalize_fortinet_shorthands(text)
         is_valid, corrected = self._validate_sentence_case(text)
-        self.results.append(ValidationResult("H4", "Sentence case", text,
-                                             Status.ACCEPTED if is_valid else Status.REJECTED,
-                                             f'"{corrected}"', "Headers"))
+        return ValidationResult("H4", "Sentence case", text,
+                                Status.ACCEPTED if is_valid else Status.REJECTED,
+                                f'"{corrected}"', "Headers")
     
     def _validate_faq_header(self, text: str):
         text = self._normalize_fortinet_shorthands(text)
         is_valid, corrected = self._validate_capital_case(text)
-        self.results.append(ValidationResult("FAQ H2 Header", "Capital Case", text,
-                                             Status.ACCEPTED if is_valid else Status.REJECTED,
-                                             f'"{corrected}"', "FAQs"))
+        return ValidationResult("FAQ H2 Header", "Capital Case", text,
+                                Status.ACCEPTED if is_valid else Status.REJECTED,
+                                f'"{corrected}"', "FAQs")
     
     def _validate_faq_question(self, text: str):
         text = self._normalize_fortinet_shorthands(text)
         is_valid, corrected = self._validate_sentence_case(text)
-        self.results.append(ValidationResult("FAQ Question", "Sentence case", text,
-                                             Status.ACCEPTED if is_valid else Status.REJECTED,
-                                             f'"{corrected}"', "FAQs"))
+        return ValidationResult("FAQ Question", "Sentence case", text,
+                                Status.ACCEPTED if is_valid else Status.REJECTED,
+                                f'"{corrected}"', "FAQs")
     
     def _validate_faq_answer(self, text: str):
         text = self._normalize_fortinet_shorthands(text)
         is_valid, corrected = self._validate_sentence_case(text)
-        self.results.append(ValidationResult("FAQ Answer", "Sentence case", text,
-                                             Status.ACCEPTED if is_valid else Status.REJECTED,
-                                             f'"{corrected}"', "FAQs"))
+        return ValidationResult("FAQ Answer", "Sentence case", text,
+                                Status.ACCEPTED if is_valid else Status.REJECTED,
+                                f'"{corrected}"', "FAQs")
     
     def _validate_product_nav_tab(self, text: str):
         """Validate product nav - USES OPENAI IF ENABLED."""
         text = self._normalize_fortinet_shorthands(text)
-        rule_valid, rule_corrected = self._validate_title_case(text)
+        rule_result = self._validate_title_case(text)
         
         if self.hybrid_validator:
-            print(f"🤖 Calling OpenAI API for Product Nav Tab...")
-            try:
-                hybrid_result = self.hybrid_validator.validate_title_case_hybrid(
-                    text, (rule_valid, rule_corrected)
-                )
-                
-                final_valid = hybrid_result['ai_valid']
-                final_corrected = hybrid_result['final_recommendation']
-                if text.strip() == final_corrected.strip().strip('"').strip("'"):
-                    final_valid = True
-                else:
-                    final_valid = hybrid_result['ai_valid']
-                
-                self.results.append(ValidationResult(
-                    "Product Nav Tab", "Title Case", text,
-                    Status.ACCEPTED if final_valid else Status.REJECTED,
-                    f'"{final_corrected}"', "Product Navigation",
-                    ai_validated=True,
-                    ai_result=hybrid_result['ai_corrected'],
-                    unknown_terms=hybrid_result['unknown_terms']
-                ))
-                return
-            except Exception as e:
-                print(f"✗ OpenAI API call failed: {e}")
+            log.debug("Calling OpenAI API for Product Nav Tab...")
+            return _HybridCheck('title', text, rule_result, self._product_nav_tab_result)
         
-        self.results.append(ValidationResult("Product Nav Tab", "Title Case", text,
-                                             Status.ACCEPTED if rule_valid else Status.REJECTED,
-                                             f'"{rule_corrected}"', "Product Navigation"))
+        return self._product_nav_tab_result(text, rule_result, None)
+    
+    def _product_nav_tab_result(self, text: str, rule_result: tuple[bool, str],
+                                hybrid_result: Optional[Dict]) -> ValidationResult:
+        """Product nav result from the AI check, or from the rules if it failed."""
+        rule_valid, rule_corrected = rule_result
+        
+        if hybrid_result is not None:
+            final_valid = hybrid_result['ai_valid']
+            final_corrected = hybrid_result['final_recommendation']
+            if text.strip() == final_corrected.strip().strip('"').strip("'"):
+                final_valid = True
+            
+            return ValidationResult(
+                "Product Nav Tab", "Title Case", text,
+                Status.ACCEPTED if final_valid else Status.REJECTED,
+                f'"{final_corrected}"', "Product Navigation",
+                ai_validated=True,
+                ai_result=hybrid_result['ai_corrected'],
+                unknown_terms=hybrid_result['unknown_terms']
+            )
+        
+        return ValidationResult("Product Nav Tab", "Title Case", text,
+                                Status.ACCEPTED if rule_valid else Status.REJECTED,
+                                f'"{rule_corrected}"', "Product Navigation")
     
     def _validate_cta_text(self, text: str):
         text = self._normalize_fortinet_shorthands(text)
         is_valid, corrected = self._validate_sentence_case(text)
-        self.results.append(ValidationResult("CTA Text", "Sentence case", text,
-                                             Status.ACCEPTED if is_valid else Status.REJECTED,
-                                             f'"{corrected}"', "CTA"))
+        return ValidationResult("CTA Text", "Sentence case", text,
+                                Status.ACCEPTED if is_valid else Status.REJECTED,
+                                f'"{corrected}"', "CTA")
     def generate_failed_items_table(self, validation_results):
         """Generate failed items table - show ALL rejected items."""
-        failed_items = []
-
-        for result in validation_results:
-            # Only check status
-            if result.status == Status.REJECTED:
-
-                current_text = result.location.strip() if result.location else ""
-                recommended_text = result.details.strip().strip('"').strip("'") if result.details else ""
-
-                fix_detail = self._extract_fix_detail(result)
-
-                row = {
-                    'Category': self._get_category(result.use_case),
-                    'Type': result.use_case,
-                    'Current': current_text,
-                    'Fix': fix_detail,
-                    'Recommended': recommended_text
-                }
-
-                if result.ai_validated:
-                    row['AI'] = '✓'
-
-                if result.unknown_terms:
-                    row['Unknown'] = ', '.join(result.unknown_terms)
-
-                failed_items.append(row)
-
-        return pd.DataFrame(failed_items)
+        import pandas as pd  # deferred: only needed once there are results to show
+        
+        # Only check status
+        failed = [result for result in validation_results if result.status is Status.REJECTED]
+        if not failed:
+            return pd.DataFrame()
+        
+        # Built column by column rather than as one dict per row
+        columns = {
+            'Category': [self._get_category(result.use_case) for result in failed],
+            'Type': [result.use_case for result in failed],
+            'Current': [result.location.strip() if result.location else "" for result in failed],
+            'Fix': [self._extract_fix_detail(result) for result in failed],
+            'Recommended': [
+                result.details.strip().strip('"').strip("'") if result.details else ""
+                for result in failed
+            ],
+        }
+        
+        # Optional columns only appear when some row has a value (NaN elsewhere)
+        if any(result.ai_validated for result in failed):
+            columns['AI'] = ['✓' if result.ai_validated else math.nan for result in failed]
+        
+        if any(result.unknown_terms for result in failed):
+            columns['Unknown'] = [
+                ', '.join(result.unknown_terms) if result.unknown_terms else math.nan
+                for result in failed
+            ]
+        
+        return pd.DataFrame(columns)
 
 
     def _get_category(self, use_case: str) -> str:
         """Map use case to category."""
+        category = self._USE_CASE_CATEGORY.get(use_case)
+        if category is not None:
+            return category
+        
         if 'Meta' in use_case:
             return 'Metadata'
         elif any(h in use_case for h in ['H1', 'H2', 'H3', 'H4', 'Header']):
@@ -590,23 +719,31 @@ class AEMBriefReviewer:
         if current_text == recommended_text:
             return "No change needed"  # ✅ FIX: Don't show "See Recommended"
         
-        current_words = re.findall(r'\S+', current_text)
-        recommended_words = re.findall(r'\S+', recommended_text)
+        current_words = _WORD_RE.findall(current_text)
+        recommended_words = _WORD_RE.findall(recommended_text)
         
         changes = []
-        max_length = max(len(current_words), len(recommended_words))
+        # Align the word lists so an added or dropped word is reported once
+        # instead of shifting every later word out of place
+        matcher = SequenceMatcher(a=current_words, b=recommended_words, autojunk=False)
         
-        for i in range(max_length):
-            current_word = current_words[i] if i < len(current_words) else ""
-            recommended_word = recommended_words[i] if i < len(recommended_words) else ""
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
             
-            if current_word != recommended_word:
+            for current_word, recommended_word in zip_longest(
+                current_words[i1:i2], recommended_words[j1:j2], fillvalue=""
+            ):
                 if current_word and recommended_word:
                     changes.append(f"{current_word} → {recommended_word}")
                 elif current_word:
                     changes.append(f"Remove: {current_word}")
                 elif recommended_word:
                     changes.append(f"Add: {recommended_word}")
+            
+            # Only the first three changes are shown
+            if len(changes) > 3:
+                break
         
         if changes:
             if len(changes) > 3:
@@ -3,25 +3,33 @@ Configuration Module
 Handles environment variables for both local and Streamlit Cloud
 """
 
+import functools
 import os
 from dotenv import load_dotenv
 
+try:
+    import streamlit as _st
+except Exception:
+    _st = None
+
 # Load local .env file (does nothing in Streamlit Cloud)
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=None)
 def get_secret(key: str) -> str:
     """
     Fetch secret from:
     1️⃣ Streamlit Cloud secrets
     2️⃣ Local .env file
+    
+    Looked up once per key; secrets don't change while the app runs.
     """
 
     # Try Streamlit secrets (Cloud)
     try:
-        import streamlit as st
-        if hasattr(st, "secrets") and key in st.secrets:
-            return st.secrets[key]
+        if _st is not None and hasattr(_st, "secrets") and key in _st.secrets:
+            return _st.secrets[key]
     except Exception:
         pass
 
@@ -30,4 +38,8 @@ def get_secret(key: str) -> str:
 
 
 # === API Keys ===
-OPENAI_API_KEY = get_secret("OPENAI_API_KEY")
\ No newline at end of file
+OPENAI_API_KEY = get_secret("OPENAI_API_KEY")
+
+# === AI Backend ===
+# 'openai' (default) or 'llama_cpp'; the local backend needs no API key
+AI_BACKEND = get_secret("AI_BACKEND") or "openai"